@@ -2,7 +2,17 @@
 
 __version__ = "0.1.0"
 
-from claude_memory.memory import MemoryManager
-from claude_memory.session import SessionTracker
-
 __all__ = ["MemoryManager", "SessionTracker"]
+
+
+def __getattr__(name):
+    # Lazy so importing a submodule (e.g. the CLI) doesn't build every model
+    if name == "MemoryManager":
+        from claude_memory.memory import MemoryManager
+
+        return MemoryManager
+    if name == "SessionTracker":
+        from claude_memory.session import SessionTracker
+
+        return SessionTracker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,44 @@
 """CLI interface for Claude Memory System."""
 
-import click
+import importlib
+import io
+import shlex
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING
+
+import click
 
-from claude_memory.memory import MemoryManager
-from claude_memory.session import SessionTracker
-from claude_memory.skills import SkillDetector, flag_skill_candidates
-from claude_memory.models import MemoryScope, MemoryType
 from claude_memory.utils import get_global_claude_dir, get_project_claude_dir
-from claude_memory.viz.timeline import timeline_cmd
-from claude_memory.viz.session import session_cmd
-from claude_memory.viz.search import search_cmd
-from claude_memory.viz.stats import stats_cmd
-from claude_memory.viz.tags import tags_cmd
-from claude_memory.viz.projects import projects_cmd
-from claude_memory.viz.health import health_cmd
+
+# Memory and model modules are imported inside commands: building the pydantic
+# models dominates startup, and --help, --version and shell completion don't need them
+if TYPE_CHECKING:
+    from claude_memory.memory import MemoryManager
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are dispatched.
+
+    Keeps viz (and its rich rendering imports) off the startup path of
+    every other CLI command.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
 
 
 @click.group()
@@ -25,6 +48,15 @@ def main():
     pass
 
 
+def _get_manager() -> "MemoryManager":
+    """Return the MemoryManager passed in by a batch run, or the shared one."""
+    from claude_memory.memory import MemoryManager
+
+    ctx = click.get_current_context(silent=True)
+    manager = ctx.find_object(MemoryManager) if ctx else None
+    return manager or MemoryManager.shared()
+
+
 @main.command()
 @click.option(
     "--scope",
@@ -34,6 +66,8 @@ def main():
 )
 def init(scope):
     """Initialize memory system."""
+    from claude_memory.memory import MemoryManager
+
     cwd = Path.cwd()
 
     if scope in ["global", "both"]:
@@ -61,7 +95,7 @@ def init(scope):
 @click.argument("task", required=False)
 def start_session(task):
     """Start a new session."""
-    manager = MemoryManager()
+    manager = _get_manager()
     session = manager.create_session()
 
     if task:
@@ -84,7 +118,10 @@ def start_session(task):
 @click.option("--summary", help="Session summary")
 def save_session(session_id, scope, tags, summary):
     """Save current session to long-term memory."""
-    manager = MemoryManager()
+    from claude_memory.models import MemoryScope
+    from claude_memory.session import SessionTracker
+
+    manager = _get_manager()
 
     # Find session
     if session_id:
@@ -94,14 +131,12 @@ def save_session(session_id, scope, tags, summary):
     else:
         # Find most recent active session
         claude_dir = manager.project_dir or manager.global_dir
-        active_sessions = SessionTracker.list_active_sessions(claude_dir)
-        if not active_sessions:
+        latest = SessionTracker.latest_active(claude_dir)
+        if not latest:
             click.echo("✗ No active sessions found")
             return
 
-        # Use most recent
-        active_sessions.sort(key=lambda s: s.last_updated, reverse=True)
-        session = SessionTracker(claude_dir, active_sessions[0].session_id)
+        session = SessionTracker(claude_dir, latest.session_id)
 
     # Determine scope
     if not scope:
@@ -151,68 +186,92 @@ def save_session(session_id, scope, tags, summary):
 @click.option("--limit", type=int, default=10, help="Limit results")
 def search(query, scope, tags, memory_type, limit):
     """Search memory."""
-    manager = MemoryManager()
+    from claude_memory.models import MemoryScope, MemoryType
+    from claude_memory.search_cache import SearchCache
+
+    manager = _get_manager()
 
     # Parse filters
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
     type_enum = MemoryType(memory_type) if memory_type else None
     scope_enum = None if scope == "both" else MemoryScope(scope)
 
-    # Search
-    results = manager.search_memory(query, tag_list, type_enum, scope_enum)
+    # Check the result cache (stamp is taken before searching so a concurrent
+    # write can only make the cached entry stale, never wrong)
+    cache = SearchCache(manager.global_dir)
+    cache_key = cache.make_key(
+        str(manager.project_dir), scope, query, tag_list, memory_type, limit
+    )
+    stamp = manager.index_state_key(scope_enum)
+    output = cache.get(cache_key, stamp)
 
-    if not results:
-        click.echo("No results found.")
-        return
+    if output is None:
+        output = _render_search_results(
+            manager.search_memory(query, tag_list, type_enum, scope_enum), limit
+        )
+        if not getattr(_batch_worker, "active", False):
+            cache.put(cache_key, stamp, output)
+
+    click.echo(output)
 
-    click.echo(f"Found {len(results)} results:\n")
 
-    for i, memory in enumerate(results[:limit], 1):
-        click.echo(f"{i}. [{memory.scope.value}] {memory.title}")
-        click.echo(f"   ID: {memory.id}")
-        click.echo(f"   Type: {memory.type.value}")
-        click.echo(f"   Created: {memory.created.strftime('%Y-%m-%d')}")
-        click.echo(f"   Tags: {', '.join(memory.tags)}")
+def _render_search_results(all_results: list, limit: int) -> str:
+    """Render the search command's output for its matching memories."""
+    if not all_results:
+        return "No results found."
+
+    lines = [f"Found {len(all_results)} results:\n"]
+
+    for i, memory in enumerate(all_results[:limit], 1):
+        lines.append(f"{i}. [{memory.scope.value}] {memory.title}")
+        lines.append(f"   ID: {memory.id}")
+        lines.append(f"   Type: {memory.type.value}")
+        lines.append(f"   Created: {memory.created.strftime('%Y-%m-%d')}")
+        lines.append(f"   Tags: {', '.join(memory.tags)}")
         if memory.summary:
-            click.echo(f"   Summary: {memory.summary[:100]}...")
-        click.echo()
+            lines.append(f"   Summary: {memory.summary[:100]}...")
+        lines.append("")
+
+    return "\n".join(lines)
 
 
 @main.command()
 @click.argument("memory_id")
 def show(memory_id):
     """Show details of a memory entry."""
-    manager = MemoryManager()
+    manager = _get_manager()
     memory = manager.get_memory(memory_id)
 
     if not memory:
         click.echo(f"✗ Memory not found: {memory_id}")
         return
 
-    click.echo(f"Title: {memory.title}")
-    click.echo(f"ID: {memory.id}")
-    click.echo(f"Type: {memory.type.value}")
-    click.echo(f"Scope: {memory.scope.value}")
-    click.echo(f"Created: {memory.created}")
-    click.echo(f"Updated: {memory.updated}")
-    click.echo(f"Tags: {', '.join(memory.tags)}")
-    click.echo(f"\nSummary:\n{memory.summary}")
-    click.echo(f"\nKeywords: {', '.join(memory.keywords)}")
-    click.echo(f"Triggers: {', '.join(memory.triggers)}")
+    lines = [f"Title: {memory.title}"]
+    lines.append(f"ID: {memory.id}")
+    lines.append(f"Type: {memory.type.value}")
+    lines.append(f"Scope: {memory.scope.value}")
+    lines.append(f"Created: {memory.created}")
+    lines.append(f"Updated: {memory.updated}")
+    lines.append(f"Tags: {', '.join(memory.tags)}")
+    lines.append(f"\nSummary:\n{memory.summary}")
+    lines.append(f"\nKeywords: {', '.join(memory.keywords)}")
+    lines.append(f"Triggers: {', '.join(memory.triggers)}")
 
     if memory.files_modified:
-        click.echo(f"\nFiles Modified:")
+        lines.append(f"\nFiles Modified:")
         for f in memory.files_modified:
-            click.echo(f"  - {f}")
+            lines.append(f"  - {f}")
 
     if memory.decisions:
-        click.echo(f"\nDecisions:")
+        lines.append(f"\nDecisions:")
         for d in memory.decisions:
-            click.echo(f"  - {d}")
+            lines.append(f"  - {d}")
 
-    click.echo(f"\nAccess Count: {memory.access.count}")
+    lines.append(f"\nAccess Count: {memory.access.count}")
     if memory.access.last_accessed:
-        click.echo(f"Last Accessed: {memory.access.last_accessed}")
+        lines.append(f"Last Accessed: {memory.access.last_accessed}")
+
+    click.echo("\n".join(lines))
 
     # Record this access
     manager.record_memory_access(memory_id)
@@ -229,7 +288,10 @@ def show(memory_id):
 @click.option("--days", type=int, default=90, help="Look back this many days")
 def analyze_skills(scope, min_occurrences, days):
     """Analyze memory for skill candidates."""
-    manager = MemoryManager()
+    from claude_memory.models import MemoryScope
+    from claude_memory.skills import SkillDetector, flag_skill_candidates
+
+    manager = _get_manager()
 
     # Get memories
     scope_enum = None if scope == "both" else MemoryScope(scope)
@@ -249,15 +311,17 @@ def analyze_skills(scope, min_occurrences, days):
         click.echo("No skill candidates detected.")
         return
 
-    click.echo(f"\nFound {len(candidates)} skill candidates:\n")
+    lines = [f"\nFound {len(candidates)} skill candidates:\n"]
 
     for candidate in candidates:
-        click.echo(f"• {candidate['name']}")
-        click.echo(f"  Type: {candidate['type']}")
-        click.echo(f"  Confidence: {candidate['confidence']}")
-        click.echo(f"  Occurrences: {candidate['occurrences']}")
-        click.echo(f"  Suggested name: {candidate['suggested_skill_name']}")
-        click.echo()
+        lines.append(f"• {candidate['name']}")
+        lines.append(f"  Type: {candidate['type']}")
+        lines.append(f"  Confidence: {candidate['confidence']}")
+        lines.append(f"  Occurrences: {candidate['occurrences']}")
+        lines.append(f"  Suggested name: {candidate['suggested_skill_name']}")
+        lines.append("")
+
+    click.echo("\n".join(lines))
 
     # Generate report
     output_dir = manager.project_dir or manager.global_dir
@@ -275,16 +339,18 @@ def analyze_skills(scope, min_occurrences, days):
 )
 def rebuild_index(scope):
     """Rebuild memory index from log entries."""
-    manager = MemoryManager()
+    from claude_memory.models import MemoryScope
+
+    manager = _get_manager()
 
     if scope == "global":
-        manager.global_index.rebuild_index()
+        manager.rebuild_index(MemoryScope.GLOBAL)
         click.echo("✓ Rebuilt global index")
     else:
         if not manager.project_index:
             click.echo("✗ Not in a project")
             return
-        manager.project_index.rebuild_index()
+        manager.rebuild_index(MemoryScope.PROJECT)
         click.echo("✓ Rebuilt project index")
 
 
@@ -300,7 +366,7 @@ def rebuild_manifest(scope):
     from claude_memory.manifest import MemoryManifest
     from claude_memory.models import MemoryScope
 
-    manager = MemoryManager()
+    manager = _get_manager()
 
     if scope in ["global", "both"]:
         # Rebuild global manifest
@@ -325,7 +391,9 @@ def rebuild_manifest(scope):
 @click.option("--auto-archive", is_flag=True, help="Automatically archive stale sessions")
 def cleanup_sessions(hours, auto_archive):
     """Cleanup stale sessions."""
-    manager = MemoryManager()
+    from claude_memory.session import SessionTracker
+
+    manager = _get_manager()
 
     for claude_dir in [manager.global_dir, manager.project_dir]:
         if not claude_dir:
@@ -350,7 +418,9 @@ def cleanup_sessions(hours, auto_archive):
 @main.command()
 def list_sessions():
     """List active sessions."""
-    manager = MemoryManager()
+    from claude_memory.session import SessionTracker
+
+    manager = _get_manager()
 
     # List global sessions
     global_sessions = SessionTracker.list_active_sessions(manager.global_dir)
@@ -380,30 +450,32 @@ def list_sessions():
 @main.command()
 def stats():
     """Show memory statistics."""
-    manager = MemoryManager()
+    manager = _get_manager()
 
     # Global stats
     global_index = manager.global_index.read_index(include_logs=True)
-    click.echo("Global Memory:")
-    click.echo(f"  Total memories: {len(global_index.memories)}")
-    click.echo(f"  Total accesses: {sum(m.access.count for m in global_index.memories)}")
+    lines = ["Global Memory:"]
+    lines.append(f"  Total memories: {len(global_index.memories)}")
+    lines.append(f"  Total accesses: {sum(m.access.count for m in global_index.memories)}")
 
     if global_index.stats:
-        click.echo(f"  By type:")
+        lines.append(f"  By type:")
         for type_name, count in global_index.stats.get("by_type", {}).items():
-            click.echo(f"    {type_name}: {count}")
+            lines.append(f"    {type_name}: {count}")
 
     # Project stats
     if manager.project_index:
         project_index = manager.project_index.read_index(include_logs=True)
-        click.echo("\nProject Memory:")
-        click.echo(f"  Total memories: {len(project_index.memories)}")
-        click.echo(f"  Total accesses: {sum(m.access.count for m in project_index.memories)}")
+        lines.append("\nProject Memory:")
+        lines.append(f"  Total memories: {len(project_index.memories)}")
+        lines.append(f"  Total accesses: {sum(m.access.count for m in project_index.memories)}")
 
         if project_index.stats:
-            click.echo(f"  By type:")
+            lines.append(f"  By type:")
             for type_name, count in project_index.stats.get("by_type", {}).items():
-                click.echo(f"    {type_name}: {count}")
+                lines.append(f"    {type_name}: {count}")
+
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -416,24 +488,35 @@ def debug(action):
       off     - Disable debug mode
       status  - Show current debug status
     """
-    manager = MemoryManager()
+    from claude_memory.context_tracker import ContextTracker
+
+    manager = _get_manager()
     debug_flag = manager.global_dir / "sessions" / "debug.flag"
 
     if action == "on":
         debug_flag.parent.mkdir(parents=True, exist_ok=True)
-        debug_flag.write_text(f"enabled at {datetime.now().isoformat()}")
+        debug_flag.touch()
+        ContextTracker.invalidate_debug_cache()
         click.echo("✓ Debug mode enabled")
         click.echo("  Context tracking will be active in your next session")
         click.echo("  Say 'show context usage' to see breakdown")
     elif action == "off":
         if debug_flag.exists():
             debug_flag.unlink()
+        ContextTracker.invalidate_debug_cache()
         click.echo("✓ Debug mode disabled")
     else:  # status
-        if debug_flag.exists():
+        try:
+            enabled_at = debug_flag.stat().st_mtime
+        except FileNotFoundError:
+            enabled_at = None
+
+        if enabled_at is not None:
+            from datetime import datetime
+
+            # The flag is an empty touchfile; its mtime records when it was enabled
             click.echo("Debug mode: ON")
-            content = debug_flag.read_text()
-            click.echo(f"  {content}")
+            click.echo(f"  enabled at {datetime.fromtimestamp(enabled_at).isoformat()}")
         else:
             click.echo("Debug mode: OFF")
 
@@ -441,27 +524,178 @@ def debug(action):
 @main.command()
 def update_current_work():
     """Update CLAUDE.md with current work section."""
-    manager = MemoryManager()
+    manager = _get_manager()
     manager.update_current_work()
     click.echo("✓ Updated CLAUDE.md with current work")
 
 
-@main.group()
+@main.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "timeline": "claude_memory.viz.timeline:timeline_cmd",
+        "session": "claude_memory.viz.session:session_cmd",
+        "search": "claude_memory.viz.search:search_cmd",
+        "stats": "claude_memory.viz.stats:stats_cmd",
+        "tags": "claude_memory.viz.tags:tags_cmd",
+        "projects": "claude_memory.viz.projects:projects_cmd",
+        "health": "claude_memory.viz.health:health_cmd",
+    },
+)
 @click.pass_context
 def viz(ctx):
     """Memory visualization commands."""
     # Create and pass MemoryManager to all subcommands
-    ctx.obj = MemoryManager()
+    ctx.obj = _get_manager()
+
+
+# Commands that only read memory state, safe to run concurrently with batch --jobs
+# (show and viz session record an access, so they run alone)
+BATCH_CONCURRENT_COMMANDS = {"search", "stats", "list-sessions", "viz"}
+BATCH_SERIAL_VIZ_COMMANDS = {"session"}
+
+# Marks batch --jobs worker threads, where search skips writing its result cache
+_batch_worker = threading.local()
+
+
+def _runs_concurrently(args: list[str]) -> bool:
+    """Check whether a batch line may run concurrently with its neighbours."""
+    if args[0] == "viz":
+        return len(args) > 1 and args[1] not in BATCH_SERIAL_VIZ_COMMANDS
+    return args[0] in BATCH_CONCURRENT_COMMANDS
+
+
+class _ThreadLocalStdout:
+    """sys.stdout proxy that lets batch worker threads buffer their own output."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self._stream
+
+    def write(self, text):
+        return self._target().write(text)
 
+    def writelines(self, lines):
+        self._target().writelines(lines)
 
-# Register viz subcommands
-viz.add_command(timeline_cmd)
-viz.add_command(session_cmd)
-viz.add_command(search_cmd)
-viz.add_command(stats_cmd)
-viz.add_command(tags_cmd)
-viz.add_command(projects_cmd)
-viz.add_command(health_cmd)
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        # Captured output is text only; without a buffer, byte writers fall
+        # back to write() instead of going around the capture
+        if name == "buffer" and self._target() is not self._stream:
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+
+def _run_batch_command(args: list[str], manager: "MemoryManager") -> bool:
+    """Dispatch one batch line through the CLI, returning True on success."""
+    if args[0] == "batch":
+        click.echo("✗ batch cannot be nested", err=True)
+        return False
+
+    try:
+        rv = main.main(args, prog_name="claude-memory", standalone_mode=False, obj=manager)
+    except click.ClickException as e:
+        e.show()
+        return False
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return False
+    except SystemExit as e:
+        return not e.code
+    except Exception as e:
+        click.echo(f"✗ {shlex.join(args)}: {e}", err=True)
+        return False
+
+    return rv in (None, 0)
+
+
+def _run_batch_captured(
+    args: list[str], manager: "MemoryManager", stdout: _ThreadLocalStdout
+) -> tuple[bool, str]:
+    """Run a batch line in a worker thread, capturing its output."""
+    buffer = io.StringIO()
+    stdout._local.buffer = buffer
+    _batch_worker.active = True
+    try:
+        ok = _run_batch_command(args, manager)
+    finally:
+        stdout._local.buffer = None
+        _batch_worker.active = False
+    return ok, buffer.getvalue()
+
+
+@main.command()
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Run consecutive read-only commands (search, stats, viz, ...) concurrently",
+)
+@click.pass_context
+def batch(ctx, jobs):
+    """Run newline-delimited commands from stdin in one process.
+
+    Each line is a regular command line without the program name, for
+    example "search auth --limit 5". Blank lines and lines starting with
+    # are skipped. All commands share one MemoryManager, so startup and
+    index loading are paid once.
+    """
+    manager = _get_manager()
+    # Many lookups share this manager, so map memory IDs to scopes once
+    manager.cache_scopes = True
+    failures = 0
+    pending: list[list[str]] = []
+
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+
+    def flush_pending():
+        # Output is printed in input order once the whole group finishes
+        nonlocal failures
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(
+                executor.map(lambda args: _run_batch_captured(args, manager, stdout), pending)
+            )
+        for ok, output in outcomes:
+            click.echo(output, nl=False)
+            failures += not ok
+        pending.clear()
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                click.echo(f"✗ Could not parse line: {line} ({e})", err=True)
+                failures += 1
+                continue
+
+            if jobs > 1 and _runs_concurrently(args):
+                pending.append(args)
+                continue
+
+            # Anything that may write runs alone, after earlier reads finish
+            if pending:
+                flush_pending()
+            failures += not _run_batch_command(args, manager)
+
+        if pending:
+            flush_pending()
+    finally:
+        sys.stdout = stdout._stream
+
+    if failures:
+        click.echo(f"✗ {failures} command(s) failed", err=True)
+        ctx.exit(1)
 
 
 @main.command()
@@ -484,39 +718,49 @@ def web(port, open, export):
         return
 
     # Launch Streamlit app
-    import subprocess
-    import webbrowser
+    import socket
     import time
+    import webbrowser
 
     app_path = Path(__file__).parent / "web" / "app.py"
 
     click.echo(f"🚀 Launching Claude Memory Dashboard on port {port}...")
     click.echo(f"   App path: {app_path}")
 
-    # Build streamlit command
-    cmd = [
-        "streamlit", "run",
-        str(app_path),
-        "--server.port", str(port),
-        "--server.headless", "true",
-        "--browser.gatherUsageStats", "false",
-    ]
-
     # Open browser if requested
     if open:
         click.echo(f"   Opening browser at http://localhost:{port}")
-        # Delay browser open slightly to let server start
+
         def open_browser():
-            time.sleep(2)
+            # Wait until the server accepts connections instead of guessing a delay
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                try:
+                    with socket.create_connection(("localhost", port), timeout=0.5):
+                        break
+                except OSError:
+                    time.sleep(0.1)
             webbrowser.open(f"http://localhost:{port}")
 
-        import threading
         threading.Thread(target=open_browser, daemon=True).start()
 
     click.echo("\n   Press Ctrl+C to stop the server\n")
 
     try:
-        subprocess.run(cmd)
+        # Run in this interpreter to skip a second Python startup
+        from streamlit import config as st_config
+        from streamlit.web import bootstrap
+    except ImportError:
+        bootstrap = None
+
+    try:
+        if bootstrap is not None:
+            st_config.set_option("server.port", port)
+            st_config.set_option("server.headless", True)
+            st_config.set_option("browser.gatherUsageStats", False)
+            bootstrap.run(str(app_path), False, [], {})
+        else:
+            _run_streamlit_subprocess(app_path, port)
     except KeyboardInterrupt:
         click.echo("\n✓ Dashboard stopped")
     except FileNotFoundError:
@@ -524,5 +768,19 @@ def web(port, open, export):
         click.echo("  Make sure streamlit is installed: pip install -e '.[web]'")
 
 
+def _run_streamlit_subprocess(app_path: Path, port: int) -> None:
+    """Launch the dashboard through the streamlit CLI (older Streamlit versions)."""
+    import subprocess
+
+    cmd = [
+        "streamlit", "run",
+        str(app_path),
+        "--server.port", str(port),
+        "--server.headless", "true",
+        "--browser.gatherUsageStats", "false",
+    ]
+    subprocess.run(cmd)
+
+
 if __name__ == "__main__":
     main()
@@ -1,13 +1,46 @@
 """Context usage tracking utilities for debug mode."""
 
+import functools
+import mmap
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import json
+
+from claude_memory.utils import loads_json
+
+# Manifest stats keys; both are unique in the manifest schema
+_TOTAL_MEMORIES_RE = re.compile(rb'"total_memories"\s*:\s*(\d+)')
+_TOTAL_TOKENS_RE = re.compile(rb'"total_tokens"\s*:\s*(\d+)')
+
+
+@functools.lru_cache(maxsize=8)
+def _budget_header(context_limit: int, memory_budget: int) -> tuple[str, ...]:
+    """Report header lines, which depend only on the budget settings.
+
+    Cached per (context_limit, memory_budget), so callers using the
+    defaults format these lines once per process.
+    """
+    budget_percent = (memory_budget / context_limit) * 100
+    return (
+        "📊 Memory System Context Usage",
+        "",
+        "**Context Budget:**",
+        f"  Total limit: {context_limit:,} tokens",
+        f"  Memory budget: {memory_budget:,} tokens ({budget_percent:.1f}%)",
+        "",
+    )
 
 
 class ContextTracker:
     """Track and estimate context usage for memory system."""
 
+    # Debug flag state per flag path: (parent dir mtime_ns, enabled)
+    _DEBUG_CACHE: dict[Path, tuple[int, bool]] = {}
+
+    # Parsed manifest stats per manifest path: (mtime_ns, stats)
+    _MANIFEST_STATS_CACHE: dict[Path, tuple[int, dict]] = {}
+
     def __init__(self, global_dir: Path, project_dir: Optional[Path] = None):
         """Initialize context tracker.
 
@@ -17,21 +50,47 @@ class ContextTracker:
         """
         self.global_dir = global_dir
         self.project_dir = project_dir
-        self.debug_enabled = self._is_debug_enabled()
+        self._usage: Optional[dict] = None
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug mode is enabled (cheap enough to check per event)."""
+        return self._is_debug_enabled()
+
+    @classmethod
+    def invalidate_debug_cache(cls) -> None:
+        """Forget cached debug flag state (call after toggling the flag)."""
+        cls._DEBUG_CACHE.clear()
 
     def _is_debug_enabled(self) -> bool:
         """Check if debug mode is enabled.
 
+        Creating or deleting the flag changes its parent directory's mtime,
+        so the flag is only re-probed when that mtime moves.
+
         Returns:
             True if debug flag exists
         """
         debug_flag = self.global_dir / "sessions" / "debug.flag"
-        return debug_flag.exists()
+        try:
+            dir_mtime = debug_flag.parent.stat().st_mtime_ns
+        except OSError:
+            return False
+
+        cached = self._DEBUG_CACHE.get(debug_flag)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
+        enabled = debug_flag.exists()
+        self._DEBUG_CACHE[debug_flag] = (dir_mtime, enabled)
+        return enabled
 
     def estimate_file_tokens(self, file_path: Path) -> int:
         """Estimate tokens in a file.
 
-        Uses rough approximation: 1 token ≈ 4 characters
+        Uses rough approximation: 1 token ≈ 4 characters. The byte size
+        from stat() stands in for the character count, which avoids reading
+        and decoding the file (identical for ASCII-heavy markdown).
 
         Args:
             file_path: Path to file
@@ -39,39 +98,120 @@ class ContextTracker:
         Returns:
             Estimated token count
         """
-        if not file_path.exists():
+        try:
+            return file_path.stat().st_size // 4
+        except OSError:
             return 0
 
+    def _read_manifest_stats(self, manifest_file: Path) -> dict:
+        """Read the stats block of a manifest file.
+
+        The totals are scanned from the raw bytes so the (possibly large)
+        index array is never parsed; the full JSON is only loaded if the
+        scan misses. Stats are cached per file and reused while its mtime
+        is unchanged.
+
+        Args:
+            manifest_file: Path to manifest.json
+
+        Returns:
+            Manifest stats dictionary (empty if missing or unreadable)
+        """
         try:
-            content = file_path.read_text()
-            return len(content) // 4
+            mtime = manifest_file.stat().st_mtime_ns
+            cached = self._MANIFEST_STATS_CACHE.get(manifest_file)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            stats = self._scan_manifest_stats(manifest_file)
+            if stats is None:
+                stats = loads_json(manifest_file.read_bytes()).get("stats", {})
         except Exception:
-            return 0
+            return {}
 
-    def get_claude_md_usage(self) -> dict:
-        """Get token usage of CLAUDE.md files.
+        self._MANIFEST_STATS_CACHE[manifest_file] = (mtime, stats)
+        return stats
+
+    def _scan_manifest_stats(self, manifest_file: Path) -> Optional[dict]:
+        """Find manifest totals with a byte scan instead of a JSON parse.
+
+        Args:
+            manifest_file: Path to manifest.json
 
         Returns:
-            Dictionary with global and project token counts
+            Dictionary with total_memories and total_tokens, or None if
+            either key was not found
         """
-        usage = {
-            "global_claude_md": 0,
-            "project_claude_md": 0,
-            "total_claude_md": 0,
-        }
+        with open(manifest_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Stats are written after the index array, so start there
+                start = max(mm.rfind(b'"stats"'), 0)
+                memories = _TOTAL_MEMORIES_RE.search(mm, start)
+                tokens = _TOTAL_TOKENS_RE.search(mm, start)
+                if not memories or not tokens:
+                    return None
+
+                # Read the groups before the map is closed
+                return {
+                    "total_memories": int(memories.group(1)),
+                    "total_tokens": int(tokens.group(1)),
+                }
+
+    def _gather_usage(self) -> dict:
+        """Collect all file sizes and manifest stats in one concurrent pass.
+
+        The result is memoized on the instance; create a new tracker to
+        pick up changes on disk.
 
-        # Global CLAUDE.md
-        global_claude = self.global_dir / "CLAUDE.md"
-        usage["global_claude_md"] = self.estimate_file_tokens(global_claude)
+        Returns:
+            Dictionary with token estimates and manifest stats per scope
+        """
+        if self._usage is not None:
+            return self._usage
 
-        # Project CLAUDE.md
+        scopes = {"global": self.global_dir}
         if self.project_dir:
-            project_claude = self.project_dir / "CLAUDE.md"
-            usage["project_claude_md"] = self.estimate_file_tokens(project_claude)
+            scopes["project"] = self.project_dir
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                scope: (
+                    executor.submit(self.estimate_file_tokens, claude_dir / "CLAUDE.md"),
+                    executor.submit(
+                        self.estimate_file_tokens, claude_dir / "memory" / "manifest.json"
+                    ),
+                    executor.submit(
+                        self._read_manifest_stats, claude_dir / "memory" / "manifest.json"
+                    ),
+                )
+                for scope, claude_dir in scopes.items()
+            }
+
+        self._usage = {
+            scope: {
+                "claude_md": claude_md.result(),
+                "manifest": manifest.result(),
+                "stats": stats.result(),
+            }
+            for scope, (claude_md, manifest, stats) in futures.items()
+        }
+        return self._usage
 
-        usage["total_claude_md"] = usage["global_claude_md"] + usage["project_claude_md"]
+    def get_claude_md_usage(self) -> dict:
+        """Get token usage of CLAUDE.md files.
 
-        return usage
+        Returns:
+            Dictionary with global and project token counts
+        """
+        usage = self._gather_usage()
+        global_tokens = usage["global"]["claude_md"]
+        project_tokens = usage["project"]["claude_md"] if "project" in usage else 0
+
+        return {
+            "global_claude_md": global_tokens,
+            "project_claude_md": project_tokens,
+            "total_claude_md": global_tokens + project_tokens,
+        }
 
     def get_manifest_usage(self) -> dict:
         """Get token usage of manifest files.
@@ -79,63 +219,34 @@ class ContextTracker:
         Returns:
             Dictionary with global and project manifest token counts
         """
-        usage = {
-            "global_manifest": 0,
-            "project_manifest": 0,
-            "total_manifests": 0,
+        usage = self._gather_usage()
+        global_tokens = usage["global"]["manifest"]
+        project_tokens = usage["project"]["manifest"] if "project" in usage else 0
+
+        return {
+            "global_manifest": global_tokens,
+            "project_manifest": project_tokens,
+            "total_manifests": global_tokens + project_tokens,
         }
 
-        # Global manifest
-        global_manifest = self.global_dir / "memory" / "manifest.json"
-        usage["global_manifest"] = self.estimate_file_tokens(global_manifest)
-
-        # Project manifest
-        if self.project_dir:
-            project_manifest = self.project_dir / "memory" / "manifest.json"
-            usage["project_manifest"] = self.estimate_file_tokens(project_manifest)
-
-        usage["total_manifests"] = usage["global_manifest"] + usage["project_manifest"]
-
-        return usage
-
     def get_memory_stats(self) -> dict:
         """Get statistics about memories from manifests.
 
         Returns:
             Dictionary with memory statistics
         """
+        usage = self._gather_usage()
+        global_stats = usage["global"]["stats"]
+        project_stats = usage["project"]["stats"] if "project" in usage else {}
+
         stats = {
             "total_memories": 0,
-            "global_memories": 0,
-            "project_memories": 0,
-            "total_memory_tokens": 0,
+            "global_memories": global_stats.get("total_memories", 0),
+            "project_memories": project_stats.get("total_memories", 0),
+            "total_memory_tokens": (
+                global_stats.get("total_tokens", 0) + project_stats.get("total_tokens", 0)
+            ),
         }
-
-        # Global manifest
-        global_manifest_file = self.global_dir / "memory" / "manifest.json"
-        if global_manifest_file.exists():
-            try:
-                with open(global_manifest_file, 'r') as f:
-                    manifest = json.load(f)
-                    stats["global_memories"] = manifest.get("stats", {}).get("total_memories", 0)
-                    global_tokens = manifest.get("stats", {}).get("total_tokens", 0)
-                    stats["total_memory_tokens"] += global_tokens
-            except Exception:
-                pass
-
-        # Project manifest
-        if self.project_dir:
-            project_manifest_file = self.project_dir / "memory" / "manifest.json"
-            if project_manifest_file.exists():
-                try:
-                    with open(project_manifest_file, 'r') as f:
-                        manifest = json.load(f)
-                        stats["project_memories"] = manifest.get("stats", {}).get("total_memories", 0)
-                        project_tokens = manifest.get("stats", {}).get("total_tokens", 0)
-                        stats["total_memory_tokens"] += project_tokens
-                except Exception:
-                    pass
-
         stats["total_memories"] = stats["global_memories"] + stats["project_memories"]
 
         return stats
@@ -154,52 +265,49 @@ class ContextTracker:
         manifest_usage = self.get_manifest_usage()
         memory_stats = self.get_memory_stats()
 
-        # Calculate memory system overhead
-        memory_overhead = claude_usage["total_claude_md"] + manifest_usage["total_manifests"]
-        memory_percent = (memory_overhead / memory_budget) * 100 if memory_budget > 0 else 0
-
-        report = []
         # Calculate always loaded vs on-demand
         always_loaded = claude_usage['total_claude_md']
         always_percent = (always_loaded / memory_budget) * 100 if memory_budget > 0 else 0
 
-        report.append("📊 Memory System Context Usage")
-        report.append("")
-        report.append(f"**Context Budget:**")
-        report.append(f"  Total limit: {context_limit:,} tokens")
-        report.append(f"  Memory budget: {memory_budget:,} tokens ({(memory_budget/context_limit)*100:.1f}%)")
-        report.append("")
-        report.append(f"**Always Loaded: {always_loaded:,} tokens ({always_percent:.1f}% of budget)**")
-        report.append("")
-        report.append("**Breakdown:**")
-        report.append(f"• CLAUDE.md files (always loaded): {claude_usage['total_claude_md']:,} tokens")
-        report.append(f"  ├─ Global: {claude_usage['global_claude_md']:,}")
-        report.append(f"  └─ Project: {claude_usage['project_claude_md']:,}")
-        report.append("")
-        report.append(f"• Manifest files (on-demand only): {manifest_usage['total_manifests']:,} tokens")
-        report.append(f"  ├─ Global: {manifest_usage['global_manifest']:,}")
-        report.append(f"  └─ Project: {manifest_usage['project_manifest']:,}")
-        report.append("")
-        report.append(f"**Memory Catalog:**")
-        report.append(f"  Total memories: {memory_stats['total_memories']}")
-        report.append(f"  ├─ Global: {memory_stats['global_memories']}")
-        report.append(f"  └─ Project: {memory_stats['project_memories']}")
-        report.append(f"  Total content size: ~{memory_stats['total_memory_tokens']:,} tokens")
-        report.append(f"  (Loaded on-demand, not in context)")
-        report.append("")
-
         # Status indicators (based on always-loaded only)
         if always_loaded > memory_budget:
-            report.append("⚠️ Always-loaded overhead exceeds budget!")
-            report.append(f"   Over by: {always_loaded - memory_budget:,} tokens")
+            status = (
+                "⚠️ Always-loaded overhead exceeds budget!",
+                f"   Over by: {always_loaded - memory_budget:,} tokens",
+            )
         elif always_loaded > memory_budget * 0.5:
-            report.append(f"⚠️ Always-loaded using {always_percent:.0f}% of budget")
-            report.append(f"   Suggestion: Consider further template optimization")
+            status = (
+                f"⚠️ Always-loaded using {always_percent:.0f}% of budget",
+                "   Suggestion: Consider further template optimization",
+            )
         else:
-            report.append("✅ Well within memory budget")
-            report.append(f"   {memory_budget - always_loaded:,} tokens available for on-demand loading")
-
-        return "\n".join(report)
+            status = (
+                "✅ Well within memory budget",
+                f"   {memory_budget - always_loaded:,} tokens available for on-demand loading",
+            )
+
+        return "\n".join((
+            *_budget_header(context_limit, memory_budget),
+            f"**Always Loaded: {always_loaded:,} tokens ({always_percent:.1f}% of budget)**",
+            "",
+            "**Breakdown:**",
+            f"• CLAUDE.md files (always loaded): {claude_usage['total_claude_md']:,} tokens",
+            f"  ├─ Global: {claude_usage['global_claude_md']:,}",
+            f"  └─ Project: {claude_usage['project_claude_md']:,}",
+            "",
+            f"• Manifest files (on-demand only): {manifest_usage['total_manifests']:,} tokens",
+            f"  ├─ Global: {manifest_usage['global_manifest']:,}",
+            f"  └─ Project: {manifest_usage['project_manifest']:,}",
+            "",
+            "**Memory Catalog:**",
+            f"  Total memories: {memory_stats['total_memories']}",
+            f"  ├─ Global: {memory_stats['global_memories']}",
+            f"  └─ Project: {memory_stats['project_memories']}",
+            f"  Total content size: ~{memory_stats['total_memory_tokens']:,} tokens",
+            "  (Loaded on-demand, not in context)",
+            "",
+            *status,
+        ))
 
     def log_memory_load(self, memory_id: str, tokens: int):
         """Log a memory load event (for future enhancement).
@@ -1,9 +1,16 @@
 """Index management with append-log for concurrent writes."""
 
+import heapq
 import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from claude_memory.models import (
     IndexLogEntry,
     MemoryEntry,
@@ -13,10 +20,15 @@ from claude_memory.models import (
 from claude_memory.utils import (
     calculate_checksum,
     generate_memory_id,
-    read_json_file,
+    loads_json,
     write_json_file,
 )
 
+try:
+    import fcntl
+except ImportError:  # Not on Windows; log writes then rely on O_APPEND alone
+    fcntl = None
+
 
 class IndexManager:
     """Manages memory index with append-log for concurrent safety."""
@@ -26,6 +38,18 @@ class IndexManager:
         self.scope = scope
         self.index_path = claude_dir / "memory" / "index.json"
         self.log_dir = claude_dir / "memory" / "index-log"
+        self.log_path = self.log_dir / "pending.jsonl"
+        self.access_log_path = claude_dir / "memory" / "access.log"
+        # Separate from the log itself, which compaction replaces
+        self.lock_path = self.log_dir / "pending.lock"
+
+        # Group commit: concurrent appends are queued and written together
+        self._pending_lines: list[bytes] = []
+        self._pending_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+
+        # Last merged index and the state_key() it was read at
+        self._cache: tuple[str, MemoryIndex] | None = None
 
     def initialize(self) -> None:
         """Initialize index structure."""
@@ -44,35 +68,51 @@ class IndexManager:
         """
         Read the memory index, optionally including log entries.
 
+        The merged index is cached and reused while state_key() is unchanged;
+        callers get a shallow copy, so reassigning its fields is safe.
+
         Args:
             include_logs: If True, merge log entries into the index
         """
-        # Read base index
-        try:
-            data = read_json_file(self.index_path)
-        except json.JSONDecodeError:
-            # Index is corrupted, rebuild from logs
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Index corrupted at {self.index_path}, rebuilding from logs...")
-
-            # Return empty index and let log merging rebuild it
-            data = None
+        if include_logs:
+            key = self.state_key()
+            if self._cache and self._cache[0] == key:
+                return self._cache[1].model_copy()
 
-        if not data:
+        # Read base index, validating straight from the raw bytes
+        try:
+            raw = self.index_path.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+
+        index = None
+        if raw.strip() not in (b"", b"{}"):
+            try:
+                index = MemoryIndex.model_validate_json(raw)
+            except ValidationError as e:
+                if not any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise
+
+                # Index is corrupted, rebuild from logs
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(f"Index corrupted at {self.index_path}, rebuilding from logs...")
+
+        if index is None:
             # Return empty index (will be populated from logs if include_logs=True)
             index = MemoryIndex(
                 scope=self.scope,
                 last_updated=datetime.now(),
                 memories=[],
             )
-        else:
-            index = MemoryIndex(**data)
 
         # Merge log entries if requested
         if include_logs:
-            log_entries = self._read_log_entries()
-            index = self._merge_log_entries(index, log_entries)
+            index = self._merge_log_entries(index, self._read_log_entries())
+            self._apply_access_entries(index, self._read_access_entries())
+            # Key was taken before reading, so a concurrent write can only
+            # make this entry stale (and missed), never wrong
+            self._cache = (key, index.model_copy())
 
         return index
 
@@ -91,6 +131,7 @@ class IndexManager:
             memory=memory,
         )
         self._append_log_entry(log_entry)
+        self._cache = None
 
     def update_memory(self, memory_id: str, memory: MemoryEntry, session_id: str) -> None:
         """
@@ -109,6 +150,7 @@ class IndexManager:
             memory_id=memory_id,
         )
         self._append_log_entry(log_entry)
+        self._cache = None
 
     def delete_memory(self, memory_id: str, session_id: str) -> None:
         """
@@ -125,6 +167,27 @@ class IndexManager:
             memory_id=memory_id,
         )
         self._append_log_entry(log_entry)
+        self._cache = None
+
+    def record_access(self, memory_id: str, query: str = "") -> None:
+        """
+        Record a memory access by appending one line to the access log.
+
+        Accesses are folded into the index when it is read and written into
+        index.json on rebuild, so recording one never rewrites memory data.
+
+        Args:
+            memory_id: ID of the accessed memory
+            query: Search query that led to the access, if any
+        """
+        entry = {"id": memory_id, "t": datetime.now().isoformat()}
+        if query:
+            entry["q"] = query
+
+        with self._log_lock():
+            with open(self.access_log_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        self._cache = None
 
     def rebuild_index(self) -> None:
         """
@@ -132,21 +195,160 @@ class IndexManager:
 
         This should be called periodically or when log entries exceed threshold.
         """
+        # Hold the log lock throughout, so an entry appended by another
+        # process after the read isn't cleared with the merged ones
+        with self._log_lock():
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Merge logs into index.json and clear them (log lock held)."""
         # Read current index and all logs
         index = self.read_index(include_logs=True)
 
-        # Update metadata
-        index.last_updated = datetime.now()
-        index.checksum = calculate_checksum(index.model_dump())
+        # Checksum the memories only, so it is stable across rebuilds; the
+        # merged index still carries the checksum stored in index.json
+        checksum = calculate_checksum(
+            {"memories": [m.model_dump() for m in index.memories]}
+        )
+
+        # Skip rewriting index.json when the logs changed nothing
+        if checksum != index.checksum:
+            # Update metadata
+            index.last_updated = datetime.now()
+            index.checksum = checksum
 
-        # Calculate stats
-        index.stats = self._calculate_stats(index)
+            # Calculate stats
+            index.stats = self._calculate_stats(index)
 
-        # Write merged index
-        self._write_index(index)
+            # Write merged index
+            self._write_index(index)
 
         # Clear log entries
         self._clear_log_entries()
+        self._clear_access_log()
+        self._cache = None
+
+    def compact_logs(self) -> int:
+        """
+        Collapse pending log entries to at most one per memory.
+
+        Unlike rebuild_index, this leaves index.json untouched, so a burst of
+        writes only rewrites the (small) log instead of the whole index. The
+        merged index returned by read_index is the same before and after.
+
+        Returns:
+            Number of pending log entries after compaction
+        """
+        with self._commit_lock, self._log_lock():
+            legacy_files = self._legacy_log_files()
+            entries = list(self._read_log_entries())
+
+            # Only updates and deletes can make entries redundant (adds
+            # carry fresh IDs), so a log without them is left as it is
+            if not legacy_files and all(e.operation == "add" for e in entries):
+                return len(entries)
+
+            compacted = self._compact_entries(entries)
+
+            if len(compacted) < len(entries) or legacy_files:
+                tmp_path = self.log_path.with_name(
+                    f"{self.log_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+                )
+                try:
+                    with open(tmp_path, "wb") as f:
+                        f.writelines(e.model_dump_json().encode() + b"\n" for e in compacted)
+                    os.replace(tmp_path, self.log_path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+                for log_file in legacy_files:
+                    os.unlink(log_file.path)
+                self._cache = None
+
+        return len(compacted)
+
+    def _compact_entries(self, entries: Iterable[IndexLogEntry]) -> list[IndexLogEntry]:
+        """
+        Reduce log entries to the last effective one per memory.
+
+        Whether a memory is in the base index is unknown here, so an update
+        stays an update until an add (or a delete) makes the outcome certain,
+        and a delete followed by an add keeps both. Entries keep the position
+        at which their memory would be inserted, so merging them yields the
+        same memories in the same order.
+
+        Args:
+            entries: Log entries, in order
+
+        Returns:
+            Compacted log entries, in merge order
+        """
+        # memory_id -> (definitely present, [(position, entry), ...])
+        latest: dict[str, tuple[bool | None, list[tuple[int, IndexLogEntry]]]] = {}
+
+        for position, entry in enumerate(entries):
+            if entry.operation == "delete" and entry.memory_id:
+                latest[entry.memory_id] = (False, [(position, entry)])
+                continue
+
+            if not entry.memory or entry.operation not in ("add", "update"):
+                continue
+
+            memory_id = entry.memory.id
+            state, kept = latest.get(memory_id, (None, []))
+
+            if state:
+                # Already present: the memory keeps its slot, an update acts as an add
+                if entry.operation == "update":
+                    entry = entry.model_copy(update={"operation": "add"})
+                latest[memory_id] = (True, [*kept[:-1], (kept[-1][0], entry)])
+            elif entry.operation == "add":
+                # Keep a preceding delete so a re-added memory moves to the end
+                kept = kept if state is False else []
+                latest[memory_id] = (True, [*kept, (position, entry)])
+            elif state is None:
+                latest[memory_id] = (None, [(position, entry)])
+            # Updates after a delete are ignored, as in _merge_log_entries
+
+        kept_entries = [pair for _, pairs in latest.values() for pair in pairs]
+        kept_entries.sort(key=lambda pair: pair[0])
+        return [entry for _, entry in kept_entries]
+
+    def state_key(self, include_access: bool = True) -> str:
+        """
+        Fingerprint the on-disk index state (base index plus pending logs).
+
+        The key changes whenever the base index is rewritten or a log entry
+        is added or cleared, so it can be used to validate derived caches.
+
+        Args:
+            include_access: Also change when an access is recorded; caches
+                that ignore access info (like search tokens) can skip it
+        """
+        try:
+            stat = self.index_path.stat()
+            base = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            base = "0:0"
+
+        try:
+            log_size = self.log_path.stat().st_size
+        except OSError:
+            log_size = 0
+
+        # Per-entry files written by older versions, until the next rebuild
+        legacy_files = self._legacy_log_files()
+        latest_legacy = legacy_files[-1].name if legacy_files else ""
+        key = f"{base}:{log_size}:{len(legacy_files)}:{latest_legacy}"
+
+        if include_access:
+            try:
+                key += f":{self.access_log_path.stat().st_size}"
+            except OSError:
+                key += ":0"
+
+        return key
 
     def should_rebuild(self, threshold: int = 20) -> bool:
         """
@@ -158,109 +360,255 @@ class IndexManager:
         Returns:
             True if rebuild is needed
         """
-        log_files = list(self.log_dir.glob("*.json"))
-        return len(log_files) >= threshold
+        return self.pending_entries() >= threshold
+
+    def pending_entries(self) -> int:
+        """Count log entries not yet merged into index.json."""
+        try:
+            pending = self.log_path.read_bytes().count(b"\n")
+        except OSError:
+            pending = 0
+
+        return pending + len(self._legacy_log_files())
+
+    def pending_accesses(self) -> int:
+        """Count recorded accesses not yet folded into index.json."""
+        try:
+            return self.access_log_path.read_bytes().count(b"\n")
+        except OSError:
+            return 0
+
+    def _legacy_log_files(self) -> list[os.DirEntry]:
+        """
+        List per-entry log files written by older versions.
+
+        Uses a single scandir pass; the timestamp-prefixed names sort in
+        write order.
+        """
+        try:
+            with os.scandir(self.log_dir) as it:
+                entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+        except OSError:
+            return []
+
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    def _read_log_entries(self) -> Iterator[IndexLogEntry]:
+        """Read log entries one at a time, in order."""
+        # Per-entry files from older versions predate everything in the log
+        for log_file in self._legacy_log_files():
+            try:
+                with open(log_file.path, "rb") as f:
+                    entry = IndexLogEntry.model_validate_json(f.read())
+            except Exception:
+                # Skip unreadable or invalid log entries
+                continue
+            yield entry
 
-    def _read_log_entries(self) -> list[IndexLogEntry]:
-        """Read all log entries."""
-        entries = []
-        log_files = sorted(self.log_dir.glob("*.json"))
+        try:
+            f = open(self.log_path, "rb")
+        except OSError:
+            return
 
-        for log_file in log_files:
-            data = read_json_file(log_file)
-            if data:
+        with f:
+            for line in f:
                 try:
-                    entry = IndexLogEntry(**data)
-                    entries.append(entry)
+                    yield IndexLogEntry.model_validate_json(line)
                 except Exception:
-                    # Skip invalid log entries
+                    # Skip invalid or partially written lines
                     pass
 
-        return entries
+    def _read_access_entries(self) -> Iterator[dict]:
+        """Read recorded accesses one at a time, in order."""
+        try:
+            f = open(self.access_log_path, "rb")
+        except OSError:
+            return
+
+        with f:
+            for line in f:
+                try:
+                    yield loads_json(line)
+                except json.JSONDecodeError:
+                    # Skip a partially written line
+                    pass
+
+    def _apply_access_entries(self, index: MemoryIndex, entries: Iterable[dict]) -> None:
+        """
+        Fold recorded accesses into the access info of index memories.
+
+        Args:
+            index: Index to update in place
+            entries: Access log entries, in order
+        """
+        memories_dict = {m.id: m for m in index.memories}
+        touched = set()
+
+        for entry in entries:
+            memory = memories_dict.get(entry.get("id"))
+            if not memory:
+                continue
+
+            try:
+                accessed = datetime.fromisoformat(entry["t"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            if not memory.access.first_accessed:
+                memory.access.first_accessed = accessed
+            memory.access.last_accessed = accessed
+            memory.access.count += 1
+
+            if entry.get("q"):
+                memory.access.recent_searches.append(
+                    {"query": entry["q"], "timestamp": entry["t"]}
+                )
+            touched.add(memory.id)
+
+        # Keep only last 10 searches
+        for memory_id in touched:
+            access = memories_dict[memory_id].access
+            access.recent_searches = access.recent_searches[-10:]
 
     def _append_log_entry(self, entry: IndexLogEntry) -> None:
-        """Append a log entry to a new file."""
-        # Generate unique log file name
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        log_file = self.log_dir / f"{timestamp}-{entry.session_id}.json"
+        """
+        Append a log entry as one line of the pending log.
 
-        # Write log entry
-        write_json_file(log_file, entry.model_dump())
+        Entries from concurrent threads are group-committed: whichever thread
+        holds the commit lock writes every line queued so far in one write.
+        When this returns, the entry is on disk (written by this thread or by
+        the one that held the lock before it).
+        """
+        line = entry.model_dump_json().encode() + b"\n"
+        with self._pending_lock:
+            self._pending_lines.append(line)
+
+        with self._commit_lock:
+            with self._pending_lock:
+                lines, self._pending_lines = self._pending_lines, []
+            if lines:
+                self._write_log_lines(lines)
+
+    def _write_log_lines(self, lines: list[bytes]) -> None:
+        """Write log lines with a single O_APPEND write."""
+        # One write keeps lines from concurrent processes intact; the lock
+        # keeps them out of a compaction or rebuild in another process
+        with self._log_lock():
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, b"".join(lines))
+            finally:
+                os.close(fd)
+
+    @contextmanager
+    def _log_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive inter-process lock on the pending and access logs.
+
+        Appends take it briefly; compaction and rebuild hold it from reading
+        the logs until they are replaced or cleared.
+        """
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
 
     def _merge_log_entries(
-        self, index: MemoryIndex, log_entries: list[IndexLogEntry]
+        self, index: MemoryIndex, log_entries: Iterable[IndexLogEntry]
     ) -> MemoryIndex:
         """
         Merge log entries into the index.
 
         Args:
             index: Base index
-            log_entries: List of log entries to merge
+            log_entries: Log entries to merge, in order
 
         Returns:
             Updated index
         """
         # Create a dict for fast lookup
         memories_dict = {m.id: m for m in index.memories}
+        changed = False
 
         # Apply log entries in order
         for entry in log_entries:
-            if entry.operation == "add" and entry.memory:
-                memories_dict[entry.memory.id] = entry.memory
+            operation = entry.operation
+            memory = entry.memory
+
+            if operation == "add" and memory:
+                memories_dict[memory.id] = memory
+                changed = True
 
-            elif entry.operation == "update" and entry.memory:
-                if entry.memory.id in memories_dict:
-                    memories_dict[entry.memory.id] = entry.memory
+            elif operation == "update" and memory:
+                if memory.id in memories_dict:
+                    memories_dict[memory.id] = memory
+                    changed = True
 
-            elif entry.operation == "delete" and entry.memory_id:
-                memories_dict.pop(entry.memory_id, None)
+            elif operation == "delete" and entry.memory_id:
+                if memories_dict.pop(entry.memory_id, None) is not None:
+                    changed = True
 
-        # Update index
-        index.memories = list(memories_dict.values())
+        # Update index (the memory list is only rebuilt if something changed)
+        if changed or len(memories_dict) != len(index.memories):
+            index.memories = list(memories_dict.values())
         index.last_updated = datetime.now()
 
         return index
 
     def _write_index(self, index: MemoryIndex) -> None:
-        """Write index to file."""
+        """Write index to file (atomically, see write_json_file)."""
         write_json_file(self.index_path, index.model_dump())
 
     def _clear_log_entries(self) -> None:
-        """Clear all log entry files."""
-        for log_file in self.log_dir.glob("*.json"):
-            log_file.unlink()
+        """Clear the pending log and any per-entry files from older versions."""
+        self.log_path.unlink(missing_ok=True)
+        for log_file in self._legacy_log_files():
+            os.unlink(log_file.path)
+
+    def _clear_access_log(self) -> None:
+        """Clear recorded accesses once they are part of the base index."""
+        self.access_log_path.unlink(missing_ok=True)
 
     def _calculate_stats(self, index: MemoryIndex) -> dict:
-        """Calculate statistics for the index."""
-        stats = {
-            "total_memories": len(index.memories),
-            "total_accesses": sum(m.access.count for m in index.memories),
-            "by_type": {},
-            "most_accessed": [],
-            "never_accessed": [],
-            "oldest_unaccessed": None,
-        }
+        """Calculate statistics for the index in a single pass."""
+        total_accesses = 0
+        by_type: dict[str, int] = {}
+        accessed: list[MemoryEntry] = []
+        never_accessed: list[str] = []
+        oldest_unaccessed: MemoryEntry | None = None
 
-        # Count by type
         for memory in index.memories:
-            type_name = memory.type.value
-            stats["by_type"][type_name] = stats["by_type"].get(type_name, 0) + 1
+            count = memory.access.count
+            total_accesses += count
 
-        # Sort by access count
-        sorted_by_access = sorted(
-            index.memories, key=lambda m: m.access.count, reverse=True
-        )
-
-        # Most accessed (top 5)
-        stats["most_accessed"] = [m.id for m in sorted_by_access[:5] if m.access.count > 0]
+            # Count by type
+            type_name = memory.type.value
+            by_type[type_name] = by_type.get(type_name, 0) + 1
 
-        # Never accessed
-        stats["never_accessed"] = [m.id for m in index.memories if m.access.count == 0]
+            if count > 0:
+                accessed.append(memory)
+            else:
+                never_accessed.append(memory.id)
+                if oldest_unaccessed is None or memory.created < oldest_unaccessed.created:
+                    oldest_unaccessed = memory
 
-        # Oldest unaccessed
-        unaccessed = [m for m in index.memories if m.access.count == 0]
-        if unaccessed:
-            oldest = min(unaccessed, key=lambda m: m.created)
-            stats["oldest_unaccessed"] = oldest.id
+        # Most accessed (top 5); nlargest keeps the stable order of sorted()
+        most_accessed = heapq.nlargest(5, accessed, key=lambda m: m.access.count)
 
-        return stats
+        return {
+            "total_memories": len(index.memories),
+            "total_accesses": total_accesses,
+            "by_type": by_type,
+            "most_accessed": [m.id for m in most_accessed],
+            "never_accessed": never_accessed,
+            "oldest_unaccessed": oldest_unaccessed.id if oldest_unaccessed else None,
+        }
@@ -5,12 +5,12 @@ their full content. This keeps context usage minimal while maintaining
 awareness of what memories exist.
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 from claude_memory.models import MemoryIndex, MemoryEntry, MemoryScope
+from claude_memory.utils import dumps_json, loads_json
 
 
 class MemoryManifest:
@@ -27,6 +27,13 @@ class MemoryManifest:
         self.scope = scope
         self.manifest_file = claude_dir / "memory" / "manifest.json"
 
+        # Loaded manifest and lookup tables, valid for _loaded_mtime
+        self._loaded: Optional[dict] = None
+        self._loaded_mtime: Optional[int] = None
+        self._by_id: dict[str, dict] = {}
+        self._by_tag: dict[str, list[int]] = {}
+        self._search_text: list[str] = []
+
     def generate_from_index(self, index: MemoryIndex) -> dict:
         """Generate manifest from memory index.
 
@@ -39,15 +46,12 @@ class MemoryManifest:
         entries = []
 
         for memory in index.memories:
-            # Estimate token count (rough approximation: 1 token ≈ 4 chars)
+            # Estimate token count (rough approximation: 1 token ≈ 4 bytes)
             file_path = self.claude_dir / "memory" / memory.file
-            size_tokens = 0
-            if file_path.exists():
-                try:
-                    content = file_path.read_text()
-                    size_tokens = len(content) // 4
-                except Exception:
-                    size_tokens = 0
+            try:
+                size_tokens = file_path.stat().st_size // 4
+            except OSError:
+                size_tokens = 0
 
             entries.append({
                 "id": memory.id,
@@ -84,24 +88,60 @@ class MemoryManifest:
             manifest: Manifest dictionary to save
         """
         self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        self.manifest_file.write_bytes(dumps_json(manifest))
+
+        # Keep what was just written as the loaded manifest, so a search or
+        # lookup after rebuild() doesn't read it back
+        self._index_entries(manifest)
+        self._loaded = manifest
+        self._loaded_mtime = self.manifest_file.stat().st_mtime_ns
 
     def load(self) -> Optional[dict]:
         """Load manifest from file.
 
+        The parsed manifest and its lookup tables are kept until the file's
+        mtime changes.
+
         Returns:
             Manifest dictionary or None if not found
         """
-        if not self.manifest_file.exists():
+        try:
+            mtime = self.manifest_file.stat().st_mtime_ns
+        except OSError:
             return None
 
+        if self._loaded is not None and self._loaded_mtime == mtime:
+            return self._loaded
+
         try:
-            with open(self.manifest_file, 'r') as f:
-                return json.load(f)
+            manifest = loads_json(self.manifest_file.read_bytes())
         except Exception:
             return None
 
+        self._index_entries(manifest)
+        self._loaded = manifest
+        self._loaded_mtime = mtime
+        return manifest
+
+    def _index_entries(self, manifest: dict):
+        """Build id, tag and lowercase text lookups for manifest entries.
+
+        Args:
+            manifest: Loaded manifest dictionary
+        """
+        self._by_id = {}
+        self._by_tag = {}
+        self._search_text = []
+
+        for position, entry in enumerate(manifest["index"]):
+            self._by_id.setdefault(entry["id"], entry)
+            for tag in set(entry["tags"]):
+                self._by_tag.setdefault(tag, []).append(position)
+            # Title and summary joined by NUL, which a query never contains
+            self._search_text.append(
+                f"{entry['title']}\0{entry.get('summary', '')}".lower()
+            )
+
     def rebuild(self, index: MemoryIndex):
         """Rebuild manifest from index.
 
@@ -120,15 +160,10 @@ class MemoryManifest:
         Returns:
             Memory info dict or None if not found
         """
-        manifest = self.load()
-        if not manifest:
+        if not self.load():
             return None
 
-        for entry in manifest["index"]:
-            if entry["id"] == memory_id:
-                return entry
-
-        return None
+        return self._by_id.get(memory_id)
 
     def search(self, query: str = "", tags: list[str] = None) -> list[dict]:
         """Search manifest for memories.
@@ -144,25 +179,24 @@ class MemoryManifest:
         if not manifest:
             return []
 
-        results = []
-        query_lower = query.lower()
-        tags = tags or []
+        entries = manifest["index"]
 
-        for entry in manifest["index"]:
-            # Match query
-            if query:
-                if query_lower not in entry["title"].lower() and \
-                   query_lower not in entry.get("summary", "").lower():
-                    continue
+        # Match tags (any of them) through the tag index, keeping manifest order
+        if tags:
+            positions = sorted({p for tag in tags for p in self._by_tag.get(tag, ())})
+        else:
+            positions = range(len(entries))
 
-            # Match tags
-            if tags:
-                if not any(tag in entry["tags"] for tag in tags):
-                    continue
+        # Match query
+        if not query:
+            return [entries[p] for p in positions]
 
-            results.append(entry)
+        query_lower = query.lower()
+        if "\0" in query_lower:
+            return []
 
-        return results
+        search_text = self._search_text
+        return [entries[p] for p in positions if query_lower in search_text[p]]
 
     def estimate_tokens(self) -> int:
         """Estimate token count of manifest file itself.
@@ -170,11 +204,7 @@ class MemoryManifest:
         Returns:
             Estimated tokens (rough approximation)
         """
-        if not self.manifest_file.exists():
-            return 0
-
         try:
-            content = self.manifest_file.read_text()
-            return len(content) // 4  # Rough: 1 token ≈ 4 chars
-        except Exception:
+            return self.manifest_file.stat().st_size // 4  # Rough: 1 token ≈ 4 bytes
+        except OSError:
             return 0
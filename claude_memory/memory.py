@@ -1,13 +1,20 @@
 """Core memory management for Claude Memory System."""
 
+import bisect
+import functools
+import json
+import re
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from claude_memory.index import IndexManager
+from claude_memory.manifest import MemoryManifest
 from claude_memory.models import (
     AccessInfo,
     Config,
     MemoryEntry,
+    MemoryIndex,
     MemoryScope,
     MemoryType,
     PromotionInfo,
@@ -20,13 +27,154 @@ from claude_memory.utils import (
     get_global_claude_dir,
     get_project_claude_dir,
     read_json_file,
+    tokenize,
     write_json_file,
 )
 
+# Framework/language keywords that become triggers when found in a task
+_TRIGGER_KEYWORDS = (
+    "python",
+    "javascript",
+    "typescript",
+    "react",
+    "vue",
+    "django",
+    "flask",
+    "fastapi",
+    "auth",
+    "database",
+    "api",
+)
+
+# Substring matches at every position (lookahead), so "fastapi" also yields "api"
+_TRIGGER_RE = re.compile(
+    "(?=(" + "|".join(sorted(map(re.escape, _TRIGGER_KEYWORDS), key=len, reverse=True)) + "))"
+)
+
+# Bump when tokenization changes so persisted inverted indexes are rebuilt
+INVERTED_INDEX_VERSION = 2
+
+
+class _InvertedIndex:
+    """Token -> memory-ID postings, with lookups for partial query tokens."""
+
+    def __init__(self, indexed_ids: set[str], postings: dict[str, set[str]]):
+        self.indexed_ids = indexed_ids
+        self.postings = postings
+
+        # Side indexes for tokens that may be part of a longer word, built
+        # on first use
+        self._terms: list[str] | None = None
+        self._reversed_terms: list[str] | None = None
+        self._trigrams: dict[str, set[str]] | None = None
+
+    def ids_for(self, token: str, starts_word: bool, ends_word: bool) -> set[str]:
+        """
+        Find the IDs of memories with an indexed term that can contain token.
+
+        Args:
+            token: Query token
+            starts_word: The token starts where a term starts
+            ends_word: The token ends where a term ends
+
+        Returns:
+            Matching memory IDs
+        """
+        if starts_word and ends_word:
+            return self.postings.get(token, set())
+
+        if starts_word:
+            terms = self._with_prefix(token)
+        elif ends_word:
+            terms = self._with_suffix(token)
+        else:
+            terms = self._containing(token)
+
+        matched: set[str] = set()
+        for term in terms:
+            matched |= self.postings[term]
+        return matched
+
+    def _with_prefix(self, token: str) -> list[str]:
+        """Terms starting with token, found by bisecting the sorted terms."""
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return _prefixed(self._terms, token)
+
+    def _with_suffix(self, token: str) -> list[str]:
+        """Terms ending with token, found by bisecting the reversed terms."""
+        if self._reversed_terms is None:
+            self._reversed_terms = sorted(term[::-1] for term in self.postings)
+        return [term[::-1] for term in _prefixed(self._reversed_terms, token[::-1])]
+
+    def _containing(self, token: str) -> list[str]:
+        """Terms containing token, narrowed with a trigram index."""
+        if len(token) < 3:
+            return [term for term in self.postings if token in term]
+
+        if self._trigrams is None:
+            trigrams: dict[str, set[str]] = {}
+            for term in self.postings:
+                for i in range(len(term) - 2):
+                    trigrams.setdefault(term[i:i + 3], set()).add(term)
+            self._trigrams = trigrams
+
+        # Intersect from the rarest trigram, then confirm the full token
+        term_sets = sorted(
+            (self._trigrams.get(token[i:i + 3], set()) for i in range(len(token) - 2)),
+            key=len,
+        )
+        terms = set.intersection(*term_sets)
+        return [term for term in terms if token in term]
+
+
+def _prefixed(sorted_terms: list[str], prefix: str) -> list[str]:
+    """Slice of a sorted term list that starts with prefix."""
+    start = bisect.bisect_left(sorted_terms, prefix)
+    end = start
+    while end < len(sorted_terms) and sorted_terms[end].startswith(prefix):
+        end += 1
+    return sorted_terms[start:end]
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a file, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    global_path: Path,
+    global_mtime: int | None,
+    project_path: Path | None,
+    project_mtime: int | None,
+) -> Config:
+    """
+    Load configuration (project takes precedence over global).
+
+    Cached per path and mtime, so unchanged config files are parsed once
+    per process; callers get the shared instance and must copy it.
+    """
+    config_data = read_json_file(global_path)
+
+    # Override with project config if exists
+    if project_mtime is not None:
+        project_config_data = read_json_file(project_path)
+        # Merge configs (project overrides global)
+        config_data.update(project_config_data)
+
+    return Config(**config_data) if config_data else Config()
+
 
 class MemoryManager:
     """Main interface for Claude Memory System."""
 
+    # Process-wide managers per (working dir, home), see shared()
+    _INSTANCES: dict[tuple[Path, Path], "MemoryManager"] = {}
+
     def __init__(self, working_dir: Path | None = None):
         """
         Initialize memory manager.
@@ -54,6 +202,46 @@ class MemoryManager:
         # Load configuration
         self.config = self._load_config()
 
+        # Inverted search index (token -> memory IDs), cached per scope and
+        # keyed on that scope's state_key(), which changes with every write
+        self._inverted: dict[MemoryScope, tuple[str, _InvertedIndex]] = {}
+
+        # Memory ID -> scope, built lazily by _scope_map() once a long-lived
+        # caller (like batch) sets cache_scopes; a single lookup is cheaper
+        # without it
+        self.cache_scopes = False
+        self._id_scope: dict[str, MemoryScope] | None = None
+
+        # Guards the caches above; batch --jobs searches from several threads
+        self._cache_lock = threading.RLock()
+
+    @classmethod
+    def shared(cls, working_dir: Path | None = None) -> "MemoryManager":
+        """
+        Get the process-wide memory manager for a working directory.
+
+        Reusing one manager keeps its parsed indexes warm and skips repeated
+        directory lookups and initialization checks.
+
+        Args:
+            working_dir: Current working directory (defaults to cwd)
+
+        Returns:
+            Shared MemoryManager instance
+        """
+        working_dir = working_dir or Path.cwd()
+        key = (working_dir.resolve(), Path.home())
+
+        manager = cls._INSTANCES.get(key)
+        if manager is None:
+            manager = cls._INSTANCES[key] = cls(working_dir)
+        return manager
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget shared managers so the next shared() call starts fresh."""
+        cls._INSTANCES.clear()
+
     def _ensure_initialized(self) -> None:
         """Ensure memory system is initialized."""
         # Always initialize global
@@ -141,19 +329,16 @@ class MemoryManager:
 
     def _load_config(self) -> Config:
         """Load configuration (project takes precedence over global)."""
-        # Load global config
         global_config_path = self.global_dir / "config.json"
-        config_data = read_json_file(global_config_path)
+        project_config_path = self.project_dir / "config.json" if self.project_dir else None
 
-        # Override with project config if exists
-        if self.project_dir:
-            project_config_path = self.project_dir / "config.json"
-            if project_config_path.exists():
-                project_config_data = read_json_file(project_config_path)
-                # Merge configs (project overrides global)
-                config_data.update(project_config_data)
-
-        return Config(**config_data) if config_data else Config()
+        config = _load_config_cached(
+            global_config_path,
+            _mtime_ns(global_config_path),
+            project_config_path,
+            _mtime_ns(project_config_path) if project_config_path else None,
+        )
+        return config.model_copy(deep=True)
 
     def create_session(self, session_id: str | None = None) -> SessionTracker:
         """
@@ -245,15 +430,37 @@ class MemoryManager:
         )
         if index_manager:
             index_manager.add_memory(memory_entry, session.session_id)
+            with self._cache_lock:
+                if self._id_scope is not None:
+                    self._id_scope[memory_id] = scope
 
-            # Check if rebuild needed
-            if index_manager.should_rebuild(
-                self.config.memory["indexRebuild"]["thresholdEntries"]
-            ):
-                index_manager.rebuild_index()
+            self._maintain_logs(scope)
 
         return memory_entry
 
+    def _maintain_logs(self, scope: MemoryScope) -> None:
+        """
+        Compact or fold a scope's logs once they pass their thresholds.
+
+        The pending log is compacted after a burst of writes, and the whole
+        index is only rewritten once the pending log or the access log grows
+        past its rebuild threshold.
+
+        Args:
+            scope: Scope that was just written to
+        """
+        index_manager = self.global_index if scope == MemoryScope.GLOBAL else self.project_index
+        rebuild_config = self.config.memory["indexRebuild"]
+        rebuild_at = rebuild_config["thresholdEntries"]
+        compact_at = rebuild_config.get("compactThresholdEntries", rebuild_at // 10)
+        access_at = rebuild_config.get("accessThresholdEntries", rebuild_at * 10)
+
+        pending = index_manager.pending_entries()
+        if pending >= rebuild_at or index_manager.pending_accesses() >= access_at:
+            self.rebuild_index(scope)
+        elif pending >= max(compact_at, 1):
+            index_manager.compact_logs()
+
     def search_memory(
         self,
         query: str = "",
@@ -278,12 +485,14 @@ class MemoryManager:
         # Search global
         if scope is None or scope == MemoryScope.GLOBAL:
             global_index = self.global_index.read_index(include_logs=True)
-            results.extend(global_index.search(query, tags, memory_type))
+            ids = self._candidate_ids(self.global_index, global_index, query)
+            results.extend(global_index.search(query, tags, memory_type, ids))
 
         # Search project
         if (scope is None or scope == MemoryScope.PROJECT) and self.project_index:
             project_index = self.project_index.read_index(include_logs=True)
-            results.extend(project_index.search(query, tags, memory_type))
+            ids = self._candidate_ids(self.project_index, project_index, query)
+            results.extend(project_index.search(query, tags, memory_type, ids))
 
         # Remove duplicates and sort
         seen = set()
@@ -295,13 +504,186 @@ class MemoryManager:
 
         return unique_results
 
+    def rebuild_index(self, scope: MemoryScope) -> None:
+        """
+        Rebuild a scope's index from its log and save its search index.
+
+        The inverted search index is only written here, where the index was
+        just rewritten; searches build it in memory when it is out of date.
+
+        Args:
+            scope: Scope whose index to rebuild
+        """
+        index_manager = self.global_index if scope == MemoryScope.GLOBAL else self.project_index
+        index_manager.rebuild_index()
+
+        index = index_manager.read_index(include_logs=True)
+        with self._cache_lock:
+            key, inverted = self._get_inverted(index_manager, index)
+            write_json_file(
+                index_manager.claude_dir / "memory" / "inverted.json",
+                {
+                    "version": INVERTED_INDEX_VERSION,
+                    "key": key,
+                    "ids": sorted(inverted.indexed_ids),
+                    "postings": {term: sorted(ids) for term, ids in inverted.postings.items()},
+                },
+                pretty=False,
+            )
+
+    def _candidate_ids(
+        self, index_manager: IndexManager, index: MemoryIndex, query: str
+    ) -> set[str] | None:
+        """
+        Find the IDs of memories that can possibly match the query.
+
+        Uses the inverted index as a prefilter; the final match is still
+        decided by MemoryIndex.search, so results are unchanged.
+
+        The query matches as a substring, so only its inner tokens must be
+        whole terms: the first may end a longer word and the last may start
+        one. Whole terms are looked up directly, and partial ones through
+        the side indexes of _InvertedIndex.
+
+        Returns:
+            Candidate memory IDs, or None if every memory is a candidate
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return None
+
+        _, inverted = self._get_inverted(index_manager, index)
+
+        # (token, starts_word, ends_word), whole terms first as they are cheapest
+        last = len(query_tokens) - 1
+        lookups = sorted(
+            {(token, i > 0, i < last) for i, token in enumerate(query_tokens)},
+            key=lambda lookup: not (lookup[1] and lookup[2]),
+        )
+
+        candidates: set[str] | None = None
+        for token, starts_word, ends_word in lookups:
+            matched = inverted.ids_for(token, starts_word, ends_word)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                break
+
+        # Memories added since the inverted index was built are always candidates
+        return candidates | {m.id for m in index.memories if m.id not in inverted.indexed_ids}
+
+    def _get_inverted(
+        self, index_manager: IndexManager, index: MemoryIndex
+    ) -> tuple[str, _InvertedIndex]:
+        """Get a scope's inverted index and its key, loading or building it as needed."""
+        with self._cache_lock:
+            # Accesses don't change searchable text, so they don't invalidate tokens
+            key = index_manager.state_key(include_access=False)
+
+            cached = self._inverted.get(index_manager.scope)
+            if cached and cached[0] == key:
+                return cached
+
+            inverted_path = index_manager.claude_dir / "memory" / "inverted.json"
+            try:
+                data = read_json_file(inverted_path)
+            except json.JSONDecodeError:
+                data = {}
+
+            if data.get("version") == INVERTED_INDEX_VERSION and data.get("key") == key:
+                inverted = _InvertedIndex(
+                    set(data.get("ids", [])),
+                    {term: set(ids) for term, ids in data.get("postings", {}).items()},
+                )
+            else:
+                inverted = _InvertedIndex(*self._rebuild_inverted(index))
+
+            self._inverted[index_manager.scope] = (key, inverted)
+            return key, inverted
+
+    def _rebuild_inverted(
+        self, index: MemoryIndex
+    ) -> tuple[set[str], dict[str, set[str]]]:
+        """Tokenize every memory in an index into token -> memory-ID postings."""
+        indexed_ids: set[str] = set()
+        postings: dict[str, set[str]] = {}
+
+        for memory in index.memories:
+            indexed_ids.add(memory.id)
+            text = " ".join(
+                (memory.title, memory.summary, *memory.keywords, *memory.triggers, *memory.tags)
+            )
+            for token in set(tokenize(text)):
+                postings.setdefault(token, set()).add(memory.id)
+
+        return indexed_ids, postings
+
+    def index_state_key(self, scope: MemoryScope | None = None) -> str:
+        """
+        Fingerprint the index state of the searched scopes.
+
+        Args:
+            scope: Only include a specific scope (None = both)
+
+        Returns:
+            Key that changes whenever any searched index changes
+        """
+        keys = []
+        if scope is None or scope == MemoryScope.GLOBAL:
+            keys.append(self.global_index.state_key())
+        if (scope is None or scope == MemoryScope.PROJECT) and self.project_index:
+            keys.append(self.project_index.state_key())
+        return "|".join(keys)
+
+    def _scope_map(self) -> dict[str, MemoryScope]:
+        """
+        Map memory IDs to their scope.
+
+        Built once from each scope's manifest (or its index when there is
+        no manifest yet) and kept up to date by this manager. IDs added by
+        other processes are missing until found by get_memory's full lookup.
+
+        Returns:
+            Memory ID to scope mapping
+        """
+        with self._cache_lock:
+            if self._id_scope is None:
+                id_scope: dict[str, MemoryScope] = {}
+                scopes = [(MemoryScope.GLOBAL, self.global_dir, self.global_index)]
+                if self.project_index:
+                    scopes.append((MemoryScope.PROJECT, self.project_dir, self.project_index))
+
+                for scope, claude_dir, index_manager in scopes:
+                    manifest = MemoryManifest(claude_dir, scope).load()
+                    if manifest:
+                        ids = [entry["id"] for entry in manifest["index"]]
+                    else:
+                        ids = [m.id for m in index_manager.read_index(include_logs=True).memories]
+                    for memory_id in ids:
+                        id_scope.setdefault(memory_id, scope)
+
+                self._id_scope = id_scope
+        return self._id_scope
+
     def get_memory(self, memory_id: str) -> MemoryEntry | None:
         """Get a specific memory entry by ID."""
         try:
-            # Try global first
+            # Only read the index of the scope the memory is known to be in
+            scope_map = self._scope_map() if self.cache_scopes else self._id_scope
+            scope = scope_map.get(memory_id) if scope_map is not None else None
+            if scope is not None:
+                index_manager = (
+                    self.global_index if scope == MemoryScope.GLOBAL else self.project_index
+                )
+                memory = index_manager.read_index(include_logs=True).find_by_id(memory_id)
+                if memory:
+                    return memory
+
+            # Unknown or stale ID: try global first
             global_index = self.global_index.read_index(include_logs=True)
             memory = global_index.find_by_id(memory_id)
             if memory:
+                if scope_map is not None:
+                    scope_map[memory_id] = memory.scope
                 return memory
 
             # Try project
@@ -309,6 +691,8 @@ class MemoryManager:
                 project_index = self.project_index.read_index(include_logs=True)
                 memory = project_index.find_by_id(memory_id)
                 if memory:
+                    if scope_map is not None:
+                        scope_map[memory_id] = memory.scope
                     return memory
 
             return None
@@ -327,54 +711,39 @@ class MemoryManager:
         if not memory:
             return
 
-        # Update access info
-        now = datetime.now()
-        if not memory.access.first_accessed:
-            memory.access.first_accessed = now
-        memory.access.last_accessed = now
-        memory.access.count += 1
-
-        if query:
-            memory.access.recent_searches.append(
-                {"query": query, "timestamp": now.isoformat()}
-            )
-            # Keep only last 10
-            memory.access.recent_searches = memory.access.recent_searches[-10:]
-
-        # Update in index
+        # Append to the scope's access log instead of rewriting the entry
         index_manager = (
             self.global_index if memory.scope == MemoryScope.GLOBAL else self.project_index
         )
         if index_manager:
-            index_manager.update_memory(memory_id, memory, "access-tracker")
+            index_manager.record_access(memory_id, query)
+            self._maintain_logs(memory.scope)
 
     def _extract_keywords(self, session: SessionTracker) -> list[str]:
         """Extract keywords from session data."""
-        keywords = []
+        keywords: set[str] = set()
 
         # Extract from task
         if session.data.task:
-            keywords.extend(session.data.task.lower().split())
+            keywords.update(session.data.task.lower().split())
 
         # Extract from decisions
         for decision in session.data.decisions:
-            keywords.extend(decision["decision"].lower().split())
+            keywords.update(decision["decision"].lower().split())
 
         # Extract from file paths (languages, frameworks)
         for file_path in session.data.files_modified:
             # Get file extension
             if "." in file_path:
                 ext = file_path.rsplit(".", 1)[-1]
-                keywords.append(ext)
+                keywords.add(ext)
 
             # Get directory names (might indicate modules)
             parts = file_path.split("/")
-            keywords.extend(parts[:-1])
-
-        # Deduplicate and filter
-        keywords = list(set(k for k in keywords if len(k) > 2))
+            keywords.update(parts[:-1])
 
-        return keywords[:20]  # Limit to 20 keywords
+        # Filter short words
+        return [k for k in keywords if len(k) > 2][:20]  # Limit to 20 keywords
 
     def _extract_triggers(self, session: SessionTracker, tags: list[str]) -> list[str]:
         """Extract triggers for lazy loading."""
@@ -388,21 +757,7 @@ class MemoryManager:
 
         # Add common framework/language keywords from task
         task_lower = session.data.task.lower() if session.data.task else ""
-        for keyword in [
-            "python",
-            "javascript",
-            "typescript",
-            "react",
-            "vue",
-            "django",
-            "flask",
-            "fastapi",
-            "auth",
-            "database",
-            "api",
-        ]:
-            if keyword in task_lower:
-                triggers.append(keyword)
+        triggers.extend(_TRIGGER_RE.findall(task_lower))
 
         return list(set(triggers))
 
@@ -439,12 +794,13 @@ class MemoryManager:
         current_work = self._generate_current_work_section(sessions, scope_label)
 
         # Replace or insert current work section
-        if "## Current Work" in content:
-            # Replace existing section
-            import re
-            # Match from ## Current Work (with optional scope label) to the next ## heading or end
-            pattern = r"## Current Work.*?\n.*?(?=\n## |\Z)"
-            content = re.sub(pattern, current_work.rstrip(), content, flags=re.DOTALL)
+        start = content.find("## Current Work")
+        if start != -1:
+            # Replace from ## Current Work (with optional scope label) to the next ## heading or end
+            end = content.find("\n## ", start + 1)
+            if end == -1:
+                end = len(content)
+            content = content[:start] + current_work.rstrip() + content[end:]
         else:
             # Insert after # Project Memory or # Global User Preferences
             lines = content.split("\n")
@@ -471,28 +827,28 @@ class MemoryManager:
 (No active sessions)
 """
 
-        md = f"## Current Work ({scope_label})\n\n"
+        parts = [f"## Current Work ({scope_label})\n\n"]
 
         for session in sessions:
-            md += f"### {session.task or 'Untitled Session'}\n"
-            md += f"**Session ID**: {session.session_id}\n"
-            md += f"**Started**: {session.started.strftime('%Y-%m-%d %H:%M')}\n"
-            md += f"**Last Updated**: {session.last_updated.strftime('%Y-%m-%d %H:%M')}\n"
+            parts.append(f"### {session.task or 'Untitled Session'}\n")
+            parts.append(f"**Session ID**: {session.session_id}\n")
+            parts.append(f"**Started**: {session.started.strftime('%Y-%m-%d %H:%M')}\n")
+            parts.append(f"**Last Updated**: {session.last_updated.strftime('%Y-%m-%d %H:%M')}\n")
 
             if session.files_modified:
-                md += "\n**Files Modified**:\n"
+                parts.append("\n**Files Modified**:\n")
                 for file in session.files_modified[:10]:  # Limit to 10
-                    md += f"  - {file}\n"
+                    parts.append(f"  - {file}\n")
                 if len(session.files_modified) > 10:
-                    md += f"  - ... and {len(session.files_modified) - 10} more\n"
+                    parts.append(f"  - ... and {len(session.files_modified) - 10} more\n")
 
             if session.todos:
-                md += "\n**TODOs**:\n"
+                parts.append("\n**TODOs**:\n")
                 for todo in session.todos[:10]:  # Limit to 10
-                    md += f"  - [ ] {todo}\n"
+                    parts.append(f"  - [ ] {todo}\n")
                 if len(session.todos) > 10:
-                    md += f"  - ... and {len(session.todos) - 10} more\n"
+                    parts.append(f"  - ... and {len(session.todos) - 10} more\n")
 
-            md += "\n---\n\n"
+            parts.append("\n---\n\n")
 
-        return md
+        return "".join(parts)
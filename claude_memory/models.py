@@ -1,11 +1,17 @@
 """Data models for Claude Memory System."""
 
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+# Recent search results kept per index, see MemoryIndex.search
+_SEARCH_CACHE_SIZE = 128
 
 
 class MemoryScope(str, Enum):
@@ -90,6 +96,12 @@ class MemoryEntry(BaseModel):
     scope_decision: ScopeDecision = Field(default_factory=ScopeDecision)
     skill_candidate: SkillCandidate = Field(default_factory=SkillCandidate)
 
+    @field_validator("tags", "keywords", "triggers")
+    @classmethod
+    def _intern_strings(cls, values: list[str]) -> list[str]:
+        """Intern short, heavily repeated strings so entries share them."""
+        return [sys.intern(value) for value in values]
+
 
 class MemoryIndex(BaseModel):
     """The memory index containing all memory entries."""
@@ -101,57 +113,155 @@ class MemoryIndex(BaseModel):
     memories: list[MemoryEntry] = Field(default_factory=list)
     stats: dict[str, Any] = Field(default_factory=dict)
 
+    # Lookup tables for the current memories list, built on first use. The
+    # dict is shared with shallow copies (model_copy), so a cached index
+    # builds them once for every copy handed out.
+    _lookups: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _get_lookups(
+        self,
+    ) -> tuple[dict[str, int], dict[str, list[int]], dict[MemoryType, list[int]]]:
+        """Get id -> position, tag -> positions and type -> positions maps."""
+        memories = self.memories
+        cached = self._lookups.get("positions")
+        if cached and cached[0] is memories and cached[1] == len(memories):
+            return cached[2]
+
+        by_id: dict[str, int] = {}
+        by_tag: dict[str, list[int]] = {}
+        by_type: dict[MemoryType, list[int]] = {}
+        for position, entry in enumerate(memories):
+            by_id.setdefault(entry.id, position)
+            for tag in set(entry.tags):
+                by_tag.setdefault(tag, []).append(position)
+            by_type.setdefault(entry.type, []).append(position)
+
+        lookups = (by_id, by_tag, by_type)
+        self._lookups["positions"] = (memories, len(memories), lookups)
+        return lookups
+
+    def _get_search_text(self) -> list[str]:
+        """Get each memory's searchable text, lowercased once.
+
+        Title, summary, keywords and triggers are joined by NUL, which a
+        query never contains, so one substring test covers every field.
+        """
+        memories = self.memories
+        cached = self._lookups.get("text")
+        if cached and cached[0] is memories and cached[1] == len(memories):
+            return cached[2]
+
+        search_text = [
+            "\0".join((entry.title, entry.summary, *entry.keywords, *entry.triggers)).lower()
+            for entry in memories
+        ]
+        self._lookups["text"] = (memories, len(memories), search_text)
+        return search_text
+
+    def _get_ranks(self) -> list[int]:
+        """Get each memory's rank in search order.
+
+        Search order is last accessed (most recent first), then created;
+        ties keep list order. Ranking every memory once turns result sorts
+        into integer comparisons.
+        """
+        memories = self.memories
+        cached = self._lookups.get("ranks")
+        if cached and cached[0] is memories and cached[1] == len(memories):
+            return cached[2]
+
+        order = sorted(
+            range(len(memories)),
+            key=lambda p: (
+                memories[p].access.last_accessed or datetime.min,
+                memories[p].created,
+            ),
+            reverse=True,
+        )
+        ranks = [0] * len(memories)
+        for rank, position in enumerate(order):
+            ranks[position] = rank
+
+        self._lookups["ranks"] = (memories, len(memories), ranks)
+        return ranks
+
     def find_by_id(self, memory_id: str) -> MemoryEntry | None:
         """Find a memory entry by ID."""
-        for entry in self.memories:
-            if entry.id == memory_id:
-                return entry
-        return None
+        position = self._get_lookups()[0].get(memory_id)
+        return self.memories[position] if position is not None else None
 
     def search(
         self,
         query: str = "",
         tags: list[str] | None = None,
         memory_type: MemoryType | None = None,
+        ids: Iterable[str] | None = None,
     ) -> list[MemoryEntry]:
-        """Search for memory entries."""
-        results = []
+        """Search for memory entries (optionally only those with the given IDs)."""
         query_lower = query.lower()
-        tags = tags or []
-
-        for entry in self.memories:
-            # Match query in title, summary, keywords, triggers
-            if query:
-                if (
-                    query_lower in entry.title.lower()
-                    or query_lower in entry.summary.lower()
-                    or any(query_lower in kw.lower() for kw in entry.keywords)
-                    or any(query_lower in t.lower() for t in entry.triggers)
-                ):
-                    pass
-                else:
-                    continue
-
-            # Match tags
-            if tags and not any(tag in entry.tags for tag in tags):
-                continue
-
-            # Match type
-            if memory_type and entry.type != memory_type:
-                continue
-
-            results.append(entry)
 
-        # Sort by last accessed (most recent first), then by created
-        results.sort(
-            key=lambda e: (
-                e.access.last_accessed or datetime.min,
-                e.created,
-            ),
-            reverse=True,
+        # Repeated searches are answered from an LRU cache, which is reset
+        # whenever the memories list or the index timestamp changes
+        memories = self.memories
+        cached = self._lookups.get("results")
+        if (
+            cached
+            and cached[0] is memories
+            and cached[1] == len(memories)
+            and cached[2] == self.last_updated
+        ):
+            result_cache = cached[3]
+        else:
+            result_cache = OrderedDict()
+            self._lookups["results"] = (memories, len(memories), self.last_updated, result_cache)
+
+        key = (
+            query_lower,
+            tuple(sorted(set(tags))) if tags else (),
+            memory_type,
+            frozenset(ids) if ids is not None else None,
         )
+        hit = result_cache.get(key)
+        if hit is not None:
+            try:
+                result_cache.move_to_end(key)
+            except KeyError:
+                # Evicted by a concurrent search in the meantime
+                pass
+            return list(hit)
+
+        by_id, by_tag, by_type = self._get_lookups()
+
+        # Narrow to candidate positions with the lookup tables
+        positions: set[int] | None = None
+        if ids is not None:
+            positions = {by_id[memory_id] for memory_id in ids if memory_id in by_id}
+        if tags:
+            tagged = {p for tag in tags for p in by_tag.get(tag, ())}
+            positions = tagged if positions is None else positions & tagged
+        if memory_type:
+            typed = by_type.get(memory_type, ())
+            positions = set(typed) if positions is None else positions.intersection(typed)
+
+        # Order comes from the ranks below, so candidates can stay unordered
+        candidates = positions if positions is not None else range(len(memories))
+
+        # Match query in title, summary, keywords, triggers
+        if query:
+            if "\0" in query_lower:
+                candidates = []
+            else:
+                search_text = self._get_search_text()
+                candidates = [p for p in candidates if query_lower in search_text[p]]
+
+        # Sort by last accessed (most recent first), then by created
+        results = [memories[p] for p in sorted(candidates, key=self._get_ranks().__getitem__)]
+
+        result_cache[key] = results
+        if len(result_cache) > _SEARCH_CACHE_SIZE:
+            result_cache.popitem(last=False)
 
-        return results
+        return list(results)
 
 
 class IndexLogEntry(BaseModel):
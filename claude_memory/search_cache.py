@@ -0,0 +1,107 @@
+"""Disk-backed result cache for repeated CLI searches.
+
+Each CLI invocation starts cold, so an in-process cache never gets a hit.
+The rendered results are stored under ~/.claude/memory/cache/search/ and
+validated against the index state they were computed from, so a hit is
+answered without reading any index.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from claude_memory.utils import read_json_file, write_json_file
+
+
+class SearchCache:
+    """LRU cache of search results keyed by normalized search filters."""
+
+    def __init__(self, claude_dir: Path, max_entries: int = 128, ttl_seconds: int = 300):
+        """Initialize search cache.
+
+        Args:
+            claude_dir: Path to the global .claude directory
+            max_entries: Maximum number of cached searches to keep
+            ttl_seconds: Age after which a cached result is ignored
+        """
+        self.cache_dir = claude_dir / "memory" / "cache" / "search"
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    def make_key(self, *filters: Any) -> str:
+        """Hash normalized search filters into a cache key.
+
+        Args:
+            filters: Values identifying the search (scope, query, tags, ...)
+
+        Returns:
+            Hex digest used as the cache file name
+        """
+        normalized = json.dumps(filters, sort_keys=True, default=str)
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str, stamp: str) -> Optional[dict]:
+        """Look up cached results.
+
+        Args:
+            key: Cache key from make_key()
+            stamp: Current index state; entries from another state are misses
+
+        Returns:
+            Cached search output, or None on miss
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            data = read_json_file(cache_file)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+        if not data or data.get("stamp") != stamp or "output" not in data:
+            return None
+        if time.time() - data.get("created", 0) > self.ttl_seconds:
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+
+        return data["output"]
+
+    def put(self, key: str, stamp: str, output: str) -> None:
+        """Store search output, evicting least recently used entries when it adds one.
+
+        Args:
+            key: Cache key from make_key()
+            stamp: Index state the results were computed from
+            output: Rendered search results
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        is_new = not cache_file.exists()
+
+        write_json_file(
+            cache_file,
+            {"stamp": stamp, "created": time.time(), "output": output},
+            pretty=False,
+        )
+        if is_new:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        with os.scandir(self.cache_dir) as it:
+            entries = [e for e in it if e.name.endswith(".json")]
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
@@ -1,16 +1,31 @@
 """Session tracking for active work."""
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from claude_memory.models import SessionData, SessionStatus
 from claude_memory.utils import (
     generate_session_id,
-    read_json_file,
     write_json_file,
 )
 
 
+# Read session files on a thread pool once there are at least this many
+_PARALLEL_READ_MIN_SESSIONS = 8
+
+
+def _read_bytes(path: str) -> bytes | None:
+    """Read a file, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 class SessionTracker:
     """Tracks an active Claude Code session."""
 
@@ -21,14 +36,17 @@ class SessionTracker:
         self.archived_dir = claude_dir / "sessions" / "archived"
         self.session_file = self.active_dir / f"{self.session_id}.json"
 
+        # While inside a `with tracker:` block, saves are deferred to its end
+        self._batch_depth = 0
+        self._dirty = False
+
         # Ensure directories exist
         self.active_dir.mkdir(parents=True, exist_ok=True)
         self.archived_dir.mkdir(parents=True, exist_ok=True)
 
         # Load or create session data
         if self.session_file.exists():
-            data = read_json_file(self.session_file)
-            self.data = SessionData(**data)
+            self.data = SessionData.model_validate_json(self.session_file.read_bytes())
         else:
             self.data = SessionData(
                 session_id=self.session_id,
@@ -37,18 +55,31 @@ class SessionTracker:
             )
             self.save()
 
+        # Mirror the de-duplicated lists as sets for O(1) membership checks
+        self._files_modified_set = set(self.data.files_modified)
+        self._todos_set = set(self.data.todos)
+
+    def __enter__(self) -> "SessionTracker":
+        """Batch changes: save once when the outermost block exits."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
     def update_task(self, task: str) -> None:
         """Update the current task description."""
         self.data.task = task
-        self._update_timestamp()
-        self.save()
+        self._mark_changed()
 
     def add_file_modified(self, file_path: str) -> None:
         """Track a file that was modified."""
-        if file_path not in self.data.files_modified:
+        if file_path not in self._files_modified_set:
+            self._files_modified_set.add(file_path)
             self.data.files_modified.append(file_path)
-            self._update_timestamp()
-            self.save()
+            self._mark_changed()
 
     def add_decision(self, decision: str, rationale: str, alternatives: list[str] | None = None) -> None:
         """Track a decision made during the session."""
@@ -60,8 +91,7 @@ class SessionTracker:
                 "timestamp": datetime.now().isoformat(),
             }
         )
-        self._update_timestamp()
-        self.save()
+        self._mark_changed()
 
     def add_problem(self, problem: str, solution: str | None = None) -> None:
         """Track a problem encountered and its solution."""
@@ -72,32 +102,37 @@ class SessionTracker:
                 "timestamp": datetime.now().isoformat(),
             }
         )
-        self._update_timestamp()
-        self.save()
+        self._mark_changed()
 
     def add_note(self, note: str) -> None:
         """Add a note to the session."""
         self.data.notes.append(note)
-        self._update_timestamp()
-        self.save()
+        self._mark_changed()
 
     def add_todo(self, todo: str) -> None:
         """Add a TODO item."""
-        if todo not in self.data.todos:
+        if todo not in self._todos_set:
+            self._todos_set.add(todo)
             self.data.todos.append(todo)
-            self._update_timestamp()
-            self.save()
+            self._mark_changed()
 
     def remove_todo(self, todo: str) -> None:
         """Remove a completed TODO item."""
-        if todo in self.data.todos:
+        if todo in self._todos_set:
             self.data.todos.remove(todo)
-            self._update_timestamp()
-            self.save()
+            if todo not in self.data.todos:
+                self._todos_set.discard(todo)
+            self._mark_changed()
 
     def save(self) -> None:
         """Save session data to file."""
         write_json_file(self.session_file, self.data.model_dump())
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save session data if there are unsaved changes."""
+        if self._dirty:
+            self.save()
 
     def archive(self, archive_name: str | None = None) -> Path:
         """
@@ -134,6 +169,7 @@ class SessionTracker:
     def discard(self) -> None:
         """Discard this session without archiving."""
         self.data.status = SessionStatus.DISCARDED
+        self._dirty = False
         if self.session_file.exists():
             self.session_file.unlink()
 
@@ -141,25 +177,52 @@ class SessionTracker:
         """Update the last_updated timestamp."""
         self.data.last_updated = datetime.now()
 
+    def _mark_changed(self) -> None:
+        """Record a change: save now, or at the end of the current batch."""
+        self._update_timestamp()
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
     @classmethod
     def list_active_sessions(cls, claude_dir: Path) -> list[SessionData]:
         """List all active sessions in a .claude directory."""
-        active_dir = claude_dir / "sessions" / "active"
-        if not active_dir.exists():
-            return []
+        paths = [entry.path for entry in cls._scan_active_sessions(claude_dir)]
+
+        # Reads release the GIL, so many files are fetched concurrently
+        if len(paths) >= _PARALLEL_READ_MIN_SESSIONS:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                contents = list(executor.map(_read_bytes, paths))
+        else:
+            contents = [_read_bytes(path) for path in paths]
 
         sessions = []
-        for session_file in active_dir.glob("*.json"):
-            data = read_json_file(session_file)
-            if data:
-                try:
-                    session = SessionData(**data)
-                    sessions.append(session)
-                except Exception:
-                    pass
+        for content in contents:
+            # Validate straight from the file bytes, skipping the dict step
+            try:
+                sessions.append(SessionData.model_validate_json(content))
+            except Exception:
+                pass
 
         return sessions
 
+    @classmethod
+    def _scan_active_sessions(cls, claude_dir: Path) -> list[os.DirEntry]:
+        """List active session files with one scandir pass."""
+        active_dir = claude_dir / "sessions" / "active"
+        try:
+            with os.scandir(active_dir) as it:
+                return [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        except OSError:
+            return []
+
+    @classmethod
+    def latest_active(cls, claude_dir: Path) -> SessionData | None:
+        """Return the most recently updated active session, if any."""
+        sessions = cls.list_active_sessions(claude_dir)
+        return max(sessions, key=lambda s: s.last_updated, default=None)
+
     @classmethod
     def cleanup_stale_sessions(
         cls, claude_dir: Path, hours_threshold: int = 24
@@ -167,6 +230,10 @@ class SessionTracker:
         """
         Find stale sessions (no activity for hours_threshold).
 
+        Every change to a session rewrites its file, so the file's mtime is
+        used as the last activity time; only files old enough to be stale
+        are parsed, and those that aren't valid sessions are skipped.
+
         Args:
             claude_dir: Path to .claude directory
             hours_threshold: Hours of inactivity to consider stale
@@ -174,66 +241,70 @@ class SessionTracker:
         Returns:
             List of stale session IDs
         """
-        sessions = cls.list_active_sessions(claude_dir)
-        stale = []
-        now = datetime.now()
+        cutoff = time.time() - hours_threshold * 3600
 
-        for session in sessions:
-            hours_since_update = (now - session.last_updated).total_seconds() / 3600
-            if hours_since_update >= hours_threshold:
-                stale.append(session.session_id)
+        stale = []
+        for entry in cls._scan_active_sessions(claude_dir):
+            try:
+                if entry.stat().st_mtime > cutoff:
+                    continue
+            except OSError:
+                # Archived or removed since the scan
+                continue
+
+            try:
+                session = SessionData.model_validate_json(_read_bytes(entry.path))
+            except Exception:
+                continue
+            stale.append(session.session_id)
 
         return stale
 
     def to_markdown(self) -> str:
         """Convert session data to markdown format."""
-        md = f"""# Session: {self.session_id}
-**Started**: {self.data.started.strftime('%Y-%m-%d %H:%M:%S')}
-**Last Updated**: {self.data.last_updated.strftime('%Y-%m-%d %H:%M:%S')}
-**Task**: {self.data.task or 'Not specified'}
-**Status**: {self.data.status.value}
-
-## Files Modified
-"""
+        parts = [
+            f"# Session: {self.session_id}\n",
+            f"**Started**: {self.data.started.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Last Updated**: {self.data.last_updated.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Task**: {self.data.task or 'Not specified'}\n",
+            f"**Status**: {self.data.status.value}\n",
+            "\n## Files Modified\n",
+        ]
         if self.data.files_modified:
-            for file in self.data.files_modified:
-                md += f"- {file}\n"
+            parts.extend(f"- {file}\n" for file in self.data.files_modified)
         else:
-            md += "- None\n"
+            parts.append("- None\n")
 
-        md += "\n## Decisions Made\n"
+        parts.append("\n## Decisions Made\n")
         if self.data.decisions:
             for dec in self.data.decisions:
-                md += f"\n### {dec['decision']}\n"
-                md += f"**Rationale**: {dec['rationale']}\n"
+                parts.append(f"\n### {dec['decision']}\n")
+                parts.append(f"**Rationale**: {dec['rationale']}\n")
                 if dec.get("alternatives"):
-                    md += "**Alternatives considered**:\n"
-                    for alt in dec["alternatives"]:
-                        md += f"- {alt}\n"
+                    parts.append("**Alternatives considered**:\n")
+                    parts.extend(f"- {alt}\n" for alt in dec["alternatives"])
         else:
-            md += "- None\n"
+            parts.append("- None\n")
 
-        md += "\n## Problems Encountered\n"
+        parts.append("\n## Problems Encountered\n")
         if self.data.problems:
             for prob in self.data.problems:
-                md += f"\n### {prob['problem']}\n"
+                parts.append(f"\n### {prob['problem']}\n")
                 if prob.get("solution"):
-                    md += f"**Solution**: {prob['solution']}\n"
+                    parts.append(f"**Solution**: {prob['solution']}\n")
         else:
-            md += "- None\n"
+            parts.append("- None\n")
 
-        md += "\n## Notes\n"
+        parts.append("\n## Notes\n")
         if self.data.notes:
-            for note in self.data.notes:
-                md += f"- {note}\n"
+            parts.extend(f"- {note}\n" for note in self.data.notes)
         else:
-            md += "- None\n"
+            parts.append("- None\n")
 
-        md += "\n## TODOs\n"
+        parts.append("\n## TODOs\n")
         if self.data.todos:
-            for todo in self.data.todos:
-                md += f"- [ ] {todo}\n"
+            parts.extend(f"- [ ] {todo}\n" for todo in self.data.todos)
         else:
-            md += "- None\n"
+            parts.append("- None\n")
 
-        return md
+        return "".join(parts)
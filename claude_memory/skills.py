@@ -2,6 +2,7 @@
 
 from collections import Counter
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
 
 from claude_memory.models import MemoryEntry, MemoryType, SkillCandidate
@@ -66,25 +67,26 @@ class SkillDetector:
         # Look for similar tasks/titles
         task_counter = Counter()
         task_memories = {}
+        group_tasks: list[str] = []
+        group_words: list[set[str]] = []
+        word_groups: dict[str, list[int]] = {}
 
         for memory in memories:
             # Normalize title for matching
             normalized = self._normalize_text(memory.title)
             key_words = set(normalized.split())
 
-            # Group by similar key words
-            for existing_task, count in task_counter.items():
-                existing_words = set(existing_task.split())
-                # If >60% overlap, consider similar
-                overlap = len(key_words & existing_words) / max(
-                    len(key_words), len(existing_words)
-                )
-                if overlap > 0.6:
-                    task_counter[existing_task] += 1
-                    task_memories.setdefault(existing_task, []).append(memory)
-                    break
+            # Group by similar key words (>60% overlap)
+            group = self._find_similar_group(key_words, group_words, word_groups, 0.6)
+            if group is not None:
+                existing_task = group_tasks[group]
+                task_counter[existing_task] += 1
+                task_memories.setdefault(existing_task, []).append(memory)
             else:
                 # New pattern
+                if normalized not in task_counter:
+                    self._add_group(key_words, group_words, word_groups)
+                    group_tasks.append(normalized)
                 task_counter[normalized] = 1
                 task_memories[normalized] = [memory]
 
@@ -116,6 +118,9 @@ class SkillDetector:
 
         # Group memories with similar decision keywords
         decision_groups = {}
+        group_keys: list[str] = []
+        group_words: list[set[str]] = []
+        word_groups: dict[str, list[int]] = {}
 
         for memory in memories:
             if memory.type == MemoryType.DECISION or memory.decisions:
@@ -125,20 +130,17 @@ class SkillDetector:
                     for decision in memory.decisions:
                         keywords.update(self._normalize_text(decision).split())
 
-                # Find matching group
-                for group_key, group_members in decision_groups.items():
-                    group_keywords = set(group_key.split())
-                    overlap = len(keywords & group_keywords) / max(
-                        len(keywords), len(group_keywords), 1
-                    )
-                    if overlap > 0.5:
-                        decision_groups[group_key].append(memory)
-                        break
-                else:
+                # Find matching group (>50% overlap)
+                group = self._find_similar_group(keywords, group_words, word_groups, 0.5)
+                if group is not None:
+                    decision_groups[group_keys[group]].append(memory)
+                elif keywords:
                     # New group
-                    if keywords:
-                        key = " ".join(sorted(keywords)[:5])
-                        decision_groups[key] = [memory]
+                    key = " ".join(sorted(keywords)[:5])
+                    if key not in decision_groups:
+                        self._add_group(set(key.split()), group_words, word_groups)
+                        group_keys.append(key)
+                    decision_groups[key] = [memory]
 
         # Find patterns
         for group_key, members in decision_groups.items():
@@ -191,6 +193,41 @@ class SkillDetector:
 
         return candidates
 
+    def _find_similar_group(
+        self,
+        words: set[str],
+        group_words: list[set[str]],
+        word_groups: dict[str, list[int]],
+        threshold: float,
+    ) -> int | None:
+        """
+        Find the first group whose words overlap `words` by more than threshold.
+
+        Overlap is shared words over the larger word count, so only groups
+        sharing a word can match; those are found through the word -> groups
+        index and checked in creation order instead of scanning every group.
+        The index also yields the shared word counts, so no set
+        intersections are needed.
+        """
+        shared = Counter(g for word in words for g in word_groups.get(word, ()))
+        for group in sorted(shared):
+            overlap = shared[group] / max(len(words), len(group_words[group]))
+            if overlap > threshold:
+                return group
+        return None
+
+    def _add_group(
+        self,
+        words: set[str],
+        group_words: list[set[str]],
+        word_groups: dict[str, list[int]],
+    ) -> None:
+        """Register a new group's words for _find_similar_group."""
+        group = len(group_words)
+        group_words.append(words)
+        for word in words:
+            word_groups.setdefault(word, []).append(group)
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text for pattern matching."""
         return (
@@ -203,12 +240,8 @@ class SkillDetector:
 
     def _merge_tags(self, memories: list[MemoryEntry]) -> list[str]:
         """Merge tags from multiple memories."""
-        all_tags = []
-        for memory in memories:
-            all_tags.extend(memory.tags)
-
-        # Return most common tags
-        tag_counts = Counter(all_tags)
+        # Count straight from each memory's tag list and return the most common
+        tag_counts = Counter(chain.from_iterable(memory.tags for memory in memories))
         return [tag for tag, _ in tag_counts.most_common(10)]
 
     def _generate_skill_name(self, task: str) -> str:
@@ -221,47 +254,40 @@ class SkillDetector:
         self, candidates: list[dict], output_file: Path
     ) -> None:
         """Generate a skill candidates report in markdown."""
-        md = "# Skill Candidates\n\n"
-        md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts = [
+            "# Skill Candidates\n\n",
+            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
 
         if not candidates:
-            md += "No skill candidates detected.\n"
+            parts.append("No skill candidates detected.\n")
         else:
             # Group by confidence
-            high_confidence = [c for c in candidates if c["confidence"] == "high"]
-            medium_confidence = [
-                c for c in candidates if c["confidence"] == "medium"
-            ]
-            low_confidence = [c for c in candidates if c["confidence"] == "low"]
-
-            if high_confidence:
-                md += "## High Confidence\n\n"
-                for candidate in high_confidence:
-                    md += self._format_candidate(candidate)
-
-            if medium_confidence:
-                md += "## Medium Confidence\n\n"
-                for candidate in medium_confidence:
-                    md += self._format_candidate(candidate)
-
-            if low_confidence:
-                md += "## Low Confidence\n\n"
-                for candidate in low_confidence:
-                    md += self._format_candidate(candidate)
+            for confidence, heading in (
+                ("high", "## High Confidence\n\n"),
+                ("medium", "## Medium Confidence\n\n"),
+                ("low", "## Low Confidence\n\n"),
+            ):
+                group = [c for c in candidates if c["confidence"] == confidence]
+                if group:
+                    parts.append(heading)
+                    for candidate in group:
+                        parts.extend(self._format_candidate(candidate))
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(md)
-
-    def _format_candidate(self, candidate: dict) -> str:
-        """Format a skill candidate for markdown."""
-        md = f"### {candidate['name']}\n"
-        md += f"- **Type**: {candidate['type']}\n"
-        md += f"- **Occurrences**: {candidate['occurrences']}\n"
-        md += f"- **Tags**: {', '.join(candidate['tags'])}\n"
-        md += f"- **Suggested Skill Name**: `{candidate['suggested_skill_name']}`\n"
-        md += f"- **Related Memories**: {len(candidate['related_memories'])}\n"
-        md += "\n"
-        return md
+        output_file.write_text("".join(parts))
+
+    def _format_candidate(self, candidate: dict) -> list[str]:
+        """Format a skill candidate as markdown lines."""
+        return [
+            f"### {candidate['name']}\n",
+            f"- **Type**: {candidate['type']}\n",
+            f"- **Occurrences**: {candidate['occurrences']}\n",
+            f"- **Tags**: {', '.join(candidate['tags'])}\n",
+            f"- **Suggested Skill Name**: `{candidate['suggested_skill_name']}`\n",
+            f"- **Related Memories**: {len(candidate['related_memories'])}\n",
+            "\n",
+        ]
 
 
 def flag_skill_candidates(
@@ -1,12 +1,21 @@
 """Utility functions for Claude Memory System."""
 
+import functools
 import hashlib
 import json
+import os
 import secrets
+import stat
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
 
 def get_global_claude_dir() -> Path:
     """Get the global .claude directory path."""
@@ -17,41 +26,58 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
     """
     Find the project root directory by looking for project markers.
 
-    Returns None if not in a project.
+    Returns None if not in a project. Results are memoized per resolved
+    start path, so repeated lookups in one process skip the marker stats.
     """
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
+    return _find_project_root(start_path.resolve(), Path.home())
+
+
+# Files or directories that mark a project root
+_PROJECT_MARKERS = frozenset(
+    {
+        ".git",
+        ".claude",
+        "package.json",
+        "pyproject.toml",
+        "Cargo.toml",
+        "go.mod",
+        "pom.xml",
+    }
+)
 
-    # Don't consider home directory or root as projects
-    home = Path.home()
 
+@functools.lru_cache(maxsize=256)
+def _find_project_root(current: Path, home: Path) -> Path | None:
+    """Walk up from current looking for project markers (see find_project_root)."""
+    # Don't consider home directory or root as projects
     while current != current.parent:
         # Stop at home directory
         if current == home:
             return None
 
-        # Check for project markers
-        if any(
-            (current / marker).exists()
-            for marker in [
-                ".git",
-                ".claude",
-                "package.json",
-                "pyproject.toml",
-                "Cargo.toml",
-                "go.mod",
-                "pom.xml",
-            ]
-        ):
-            return current
+        # Check for project markers with one directory listing per level
+        try:
+            with os.scandir(current) as it:
+                if any(
+                    entry.name in _PROJECT_MARKERS and os.path.exists(entry.path)
+                    for entry in it
+                ):
+                    return current
+        except OSError:
+            pass
 
         current = current.parent
 
     return None
 
 
+# Forget memoized roots, e.g. after creating a marker in a directory
+find_project_root.cache_clear = _find_project_root.cache_clear
+
+
 def get_project_claude_dir(start_path: Path | None = None) -> Path | None:
     """Get the project .claude directory path, if in a project."""
     project_root = find_project_root(start_path)
@@ -80,29 +106,104 @@ def generate_memory_id(prefix: str = "memory") -> str:
 
 
 def calculate_checksum(data: dict[str, Any]) -> str:
-    """Calculate a checksum for data."""
-    json_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(json_str.encode()).hexdigest()[:16]
+    """Calculate a checksum for data (16 hex chars, for change detection)."""
+    payload = dumps_json(data, pretty=False, sort_keys=True)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+# Byte table mapping ASCII letters/digits to lowercase and everything else to a space
+_LOWER_ALNUM_TABLE = bytes(
+    c if chr(c).isascii() and chr(c).isalnum() else ord(" ") for c in range(256)
+).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase ASCII alphanumeric tokens for indexing.
+
+    Lowercasing happens before non-ASCII characters are dropped, so a
+    substring of the lowercased text always tokenizes to substrings of
+    the text's tokens.
+    """
+    return (
+        text.lower()
+        .encode("ascii", "ignore")
+        .translate(_LOWER_ALNUM_TABLE)
+        .decode("ascii")
+        .split()
+    )
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any, pretty: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize JSON to bytes, using orjson when it is installed.
+
+    Both paths produce the same UTF-8 text: datetimes and other non-JSON
+    values go through str(), and pretty output is indented by two spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=str, option=option)
+
+    if pretty:
+        text = json.dumps(
+            data, indent=2, default=str, ensure_ascii=False, sort_keys=sort_keys
+        )
+    else:
+        text = json.dumps(
+            data, separators=(",", ":"), default=str, ensure_ascii=False, sort_keys=sort_keys
+        )
+    return text.encode()
 
 
 def read_json_file(path: Path) -> dict[str, Any]:
     """Read a JSON file."""
-    if not path.exists():
+    try:
+        return loads_json(path.read_bytes())
+    except FileNotFoundError:
         return {}
 
-    with open(path) as f:
-        return json.load(f)
-
 
 def write_json_file(path: Path, data: dict[str, Any], pretty: bool = True) -> None:
-    """Write a JSON file."""
+    """Write a JSON file atomically.
+
+    The document is serialized up front and written to a temporary file in a
+    single write, then renamed over path, so readers never see a torn file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    content = dumps_json(data, pretty)
 
-    with open(path, "w") as f:
-        if pretty:
-            json.dump(data, f, indent=2, default=str)
-        else:
-            json.dump(data, f, default=str)
+    # Per-process and per-thread temp name, so concurrent writers don't collide
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # 0o666 lets the umask decide, as a plain open() would
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+        # Keep the permissions of the file being replaced (e.g. 0600)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def ensure_directory(path: Path) -> None:
@@ -1,26 +1,46 @@
 """Export utilities for visualization data."""
 
+import html
 import json
+from collections.abc import Iterator
 from datetime import datetime
-from io import StringIO
+from enum import Enum
 from typing import Any, Optional
 
-from rich.console import Console
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
 
 
-def export_to_json(data: Any, pretty: bool = True) -> str:
-    """Export data to JSON format."""
+def _json_serializer(obj):
+    """Custom JSON serializer for datetime and other types."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def export_to_json_bytes(data: Any, pretty: bool = True) -> bytes:
+    """Export data to UTF-8 encoded JSON (same document as export_to_json)."""
+    if orjson is not None:
+        # orjson writes datetimes and enums natively, the serializer is a fallback
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, default=_json_serializer, option=option)
+
+    return export_to_json(data, pretty).encode()
 
-    def json_serializer(obj):
-        """Custom JSON serializer for datetime and other types."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Type {type(obj)} not serializable")
+
+def export_to_json(data: Any, pretty: bool = True) -> str:
+    """Export data to JSON format (datetimes as ISO 8601, enums as their value)."""
+    if orjson is not None:
+        return export_to_json_bytes(data, pretty).decode()
 
     if pretty:
-        return json.dumps(data, indent=2, default=json_serializer)
+        return json.dumps(data, indent=2, default=_json_serializer, ensure_ascii=False)
     else:
-        return json.dumps(data, default=json_serializer)
+        return json.dumps(data, default=_json_serializer, ensure_ascii=False)
 
 
 def export_to_markdown(title: str, sections: list[tuple[str, str]]) -> str:
@@ -45,76 +65,92 @@ def export_to_markdown(title: str, sections: list[tuple[str, str]]) -> str:
     return "\n".join(lines)
 
 
-def export_to_html(console_output: str, title: str = "Memory Visualization") -> str:
-    """Export Rich console output to HTML format."""
-    # Use Rich's HTML export
-    from rich.console import Console
-
-    string_io = StringIO()
-    html_console = Console(file=string_io, record=True, force_terminal=True, width=120)
-
-    # This is a simple wrapper - the actual rendering should be done by the command
-    html_template = f"""<!DOCTYPE html>
+# Page for export_to_html; substitutes title, title, date and body, all pre-escaped
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{title}</title>
+    <title>%s</title>
     <style>
-        body {{
+        body {
             font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', 'Consolas', monospace;
             background-color: #1e1e1e;
             color: #d4d4d4;
             padding: 20px;
             margin: 0;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
-        pre {{
+        }
+        pre {
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <h1>{title}</h1>
-        <p><em>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}</em></p>
-        <pre>{console_output}</pre>
+        <h1>%s</h1>
+        <p><em>Generated on %s</em></p>
+        <pre>%s</pre>
     </div>
 </body>
 </html>"""
 
-    return html_template
+
+def export_to_html(console_output: str, title: str = "Memory Visualization") -> str:
+    """Export plain-text console output to HTML format (title and output are escaped)."""
+    # This is a simple wrapper - the actual rendering should be done by the command
+    escaped_title = html.escape(title)
+    return _HTML_TEMPLATE % (
+        escaped_title,
+        escaped_title,
+        datetime.now().strftime('%Y-%m-%d %H:%M'),
+        html.escape(console_output, quote=False),
+    )
+
+
+def _memory_to_dict(memory) -> dict:
+    """Convert a memory entry to the dict written by the JSON exports."""
+    return {
+        "id": memory.id,
+        "title": memory.title,
+        "type": memory.type.value,
+        "scope": memory.scope.value,
+        "created": memory.created,
+        "updated": memory.updated,
+        "tags": memory.tags,
+        "summary": memory.summary,
+        "keywords": memory.keywords,
+        "files_modified": memory.files_modified,
+        "decisions": memory.decisions,
+        "access": {
+            "count": memory.access.count if memory.access else 0,
+            "last_accessed": memory.access.last_accessed,
+            "first_accessed": memory.access.first_accessed,
+        } if memory.access else None,
+    }
 
 
 def memories_to_json(memories: list) -> str:
     """Convert memory entries to JSON format."""
-    data = []
+    return export_to_json([_memory_to_dict(memory) for memory in memories])
 
-    for memory in memories:
-        entry = {
-            "id": memory.id,
-            "title": memory.title,
-            "type": memory.type.value,
-            "scope": memory.scope.value,
-            "created": memory.created.isoformat() if memory.created else None,
-            "updated": memory.updated.isoformat() if memory.updated else None,
-            "tags": memory.tags,
-            "summary": memory.summary,
-            "keywords": memory.keywords,
-            "files_modified": memory.files_modified,
-            "decisions": memory.decisions,
-            "access": {
-                "count": memory.access.count if memory.access else 0,
-                "last_accessed": memory.access.last_accessed.isoformat() if memory.access and memory.access.last_accessed else None,
-                "first_accessed": memory.access.first_accessed.isoformat() if memory.access and memory.access.first_accessed else None,
-            } if memory.access else None,
-        }
-        data.append(entry)
 
-    return export_to_json(data)
+def memories_to_json_bytes(memories: list) -> bytes:
+    """Convert memory entries to UTF-8 encoded JSON, ready to write to a binary stream."""
+    return export_to_json_bytes([_memory_to_dict(memory) for memory in memories])
+
+
+def memories_to_ndjson(memories: list) -> Iterator[str]:
+    """Convert memory entries to newline-delimited JSON, one line at a time.
+
+    Each line is written as soon as it's produced, so large exports never
+    hold the whole document in memory.
+    """
+    for memory in memories:
+        yield export_to_json(_memory_to_dict(memory), pretty=False) + "\n"
 
 
 def memories_to_markdown(memories: list, title: str = "Memory Search Results") -> str:
@@ -125,10 +161,12 @@ def memories_to_markdown(memories: list, title: str = "Memory Search Results") -
     summary = f"Total memories: {len(memories)}"
     sections.append(("Summary", summary))
 
-    # Memories section
-    entries = []
+    # Memories section, all in one list of lines with a blank line between memories
+    entry_lines = []
     for i, memory in enumerate(memories, 1):
-        entry_lines = [
+        if i > 1:
+            entry_lines.append("")
+        entry_lines += [
             f"### {i}. {memory.title or 'Untitled'}",
             "",
             f"- **ID**: `{memory.id}`",
@@ -165,9 +203,7 @@ def memories_to_markdown(memories: list, title: str = "Memory Search Results") -
             if len(memory.decisions) > 5:
                 entry_lines.append(f"*(and {len(memory.decisions) - 5} more)*")
 
-        entries.append("\n".join(entry_lines))
-
-    sections.append(("Memories", "\n\n".join(entries)))
+    sections.append(("Memories", "\n".join(entry_lines)))
 
     return export_to_markdown(title, sections)
 
@@ -1,15 +1,31 @@
 """Memory health check utilities."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.table import Table
 
 from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
+from claude_memory.utils import loads_json
 from claude_memory.viz.utils import console, print_header, print_section, truncate_text
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    Indel = None
+
+# Slack for comparing rapidfuzz's float bound against the threshold
+_BOUND_EPSILON = 1e-9
+
+# Check files on a thread pool once there are at least this many
+_PARALLEL_CHECK_MIN_FILES = 8
+
 
 def check_index_integrity(manager: MemoryManager) -> dict:
     """Check index file integrity."""
@@ -40,9 +56,31 @@ def check_index_integrity(manager: MemoryManager) -> dict:
     return {"status": "OK" if not issues else "WARNING", "issues": issues}
 
 
+def _failed_checks(paths: list[Path], check) -> list[tuple[Path, Exception]]:
+    """Run check on each file, returning (path, error) for those that raised, in order.
+
+    Checks are file reads, so with many files they run on a thread pool.
+    """
+
+    def run(path: Path) -> Optional[Exception]:
+        try:
+            check(path)
+        except Exception as e:
+            return e
+        return None
+
+    if len(paths) >= _PARALLEL_CHECK_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            errors = list(executor.map(run, paths))
+    else:
+        errors = [run(path) for path in paths]
+
+    return [(path, error) for path, error in zip(paths, errors) if error is not None]
+
+
 def check_session_files(manager: MemoryManager) -> dict:
     """Check session file validity."""
-    issues = []
+    session_files = []
 
     for claude_dir in [manager.global_dir, manager.project_dir]:
         if not claude_dir:
@@ -50,20 +88,21 @@ def check_session_files(manager: MemoryManager) -> dict:
 
         active_dir = claude_dir / "sessions" / "active"
         if active_dir.exists():
-            for session_file in active_dir.glob("*.json"):
-                try:
-                    import json
-                    with open(session_file) as f:
-                        json.load(f)
-                except Exception as e:
-                    issues.append(f"Invalid session file: {session_file.name} - {e}")
+            session_files.extend(active_dir.glob("*.json"))
+
+    issues = [
+        f"Invalid session file: {session_file.name} - {e}"
+        for session_file, e in _failed_checks(
+            session_files, lambda path: loads_json(path.read_bytes())
+        )
+    ]
 
     return {"status": "OK" if not issues else "ERROR", "issues": issues}
 
 
 def check_markdown_archives(manager: MemoryManager) -> dict:
     """Check markdown archive readability."""
-    issues = []
+    md_files = []
 
     for claude_dir in [manager.global_dir, manager.project_dir]:
         if not claude_dir:
@@ -71,60 +110,93 @@ def check_markdown_archives(manager: MemoryManager) -> dict:
 
         memory_dir = claude_dir / "memory" / "sessions"
         if memory_dir.exists():
-            for md_file in memory_dir.glob("*.md"):
-                try:
-                    md_file.read_text()
-                except Exception as e:
-                    issues.append(f"Unreadable archive: {md_file.name} - {e}")
+            md_files.extend(memory_dir.glob("*.md"))
 
-    return {"status": "OK" if not issues else "WARNING", "issues": issues}
+    issues = [
+        f"Unreadable archive: {md_file.name} - {e}"
+        for md_file, e in _failed_checks(md_files, Path.read_text)
+    ]
 
+    return {"status": "OK" if not issues else "WARNING", "issues": issues}
 
-def find_untagged_sessions(memories: list) -> list:
-    """Find sessions with no tags."""
-    return [m for m in memories if not m.tags or len(m.tags) == 0]
 
+def _find_quality_issues(memories: list, days_threshold: int = 180) -> tuple[list, list, list]:
+    """Find untagged, never accessed and stale memories in a single pass.
 
-def find_never_accessed(memories: list) -> list:
-    """Find memories that have never been accessed."""
-    return [m for m in memories if not m.access or m.access.count == 0]
+    The find_* helpers below each return one of these lists, so the
+    criteria live only here.
+    """
+    cutoff_date = datetime.now() - timedelta(days=days_threshold)
 
+    untagged = []
+    never_accessed = []
+    stale = []
+    for m in memories:
+        if not m.tags:
+            untagged.append(m)
+        if not m.access or m.access.count == 0:
+            never_accessed.append(m)
+            if m.created and m.created < cutoff_date:
+                stale.append(m)
 
-def find_potential_duplicates(memories: list, similarity_threshold: float = 0.8) -> list:
-    """Find memories with very similar titles."""
-    duplicates = []
+    return untagged, never_accessed, stale
 
-    for i, mem1 in enumerate(memories):
-        for mem2 in memories[i + 1 :]:
-            title1 = mem1.title or ""
-            title2 = mem2.title or ""
 
-            if not title1 or not title2:
-                continue
+def find_untagged_sessions(memories: list) -> list:
+    """Find sessions with no tags."""
+    return _find_quality_issues(memories)[0]
 
-            similarity = SequenceMatcher(None, title1.lower(), title2.lower()).ratio()
-            if similarity >= similarity_threshold:
-                duplicates.append((mem1, mem2, similarity))
 
-    return duplicates
+def find_never_accessed(memories: list) -> list:
+    """Find memories that have never been accessed."""
+    return _find_quality_issues(memories)[1]
 
 
 def find_stale_sessions(memories: list, days_threshold: int = 180) -> list:
     """Find old sessions with zero accesses."""
-    cutoff_date = datetime.now() - timedelta(days=days_threshold)
+    return _find_quality_issues(memories, days_threshold)[2]
 
-    stale = []
-    for m in memories:
-        if not m.created:
-            continue
 
-        is_old = m.created < cutoff_date
-        is_unaccessed = not m.access or m.access.count == 0
+def find_potential_duplicates(memories: list, similarity_threshold: float = 0.8) -> list:
+    """Find memories with very similar titles."""
+    titles = [(m.title or "").lower() for m in memories]
+
+    # Visit titles shortest first: a pair's ratio can't exceed
+    # 2 * shorter / (len1 + len2), so once a longer title fails that bound
+    # every later (longer still) title does too
+    order = sorted((i for i, title in enumerate(titles) if title), key=lambda i: len(titles[i]))
+
+    # One matcher per second title: SequenceMatcher caches what it learns
+    # about its second sequence, so only the first is swapped per pair
+    matchers: dict[int, SequenceMatcher] = {}
+
+    found = []
+    for position, i in enumerate(order):
+        for j in order[position + 1 :]:
+            first, second = min(i, j), max(i, j)
+            matcher = matchers.get(second)
+            if matcher is None:
+                matcher = matchers[second] = SequenceMatcher(None, "", titles[second])
+            matcher.set_seq1(titles[first])
+            if matcher.real_quick_ratio() < similarity_threshold:
+                break
+
+            # Matching blocks form a common subsequence, so ratio() never
+            # exceeds 2 * LCS / (len1 + len2), which rapidfuzz computes in C
+            if Indel is not None:
+                bound = Indel.normalized_similarity(titles[first], titles[second])
+                if bound < similarity_threshold - _BOUND_EPSILON:
+                    continue
+            elif matcher.quick_ratio() < similarity_threshold:
+                continue
 
-        if is_old and is_unaccessed:
-            stale.append(m)
+            similarity = matcher.ratio()
+            if similarity >= similarity_threshold:
+                found.append((first, second, similarity))
 
-    return stale
+    # Report pairs in the order of a plain pairwise scan
+    found.sort(key=lambda pair: (pair[0], pair[1]))
+    return [(memories[i], memories[j], similarity) for i, j, similarity in found]
 
 
 def render_health_check(memories: list, manager: MemoryManager):
@@ -154,16 +226,15 @@ def render_health_check(memories: list, manager: MemoryManager):
 
     console.print()
 
-    # Quality checks
+    # Quality checks (untagged, never accessed and stale share one pass)
     warnings = []
+    untagged, never_accessed, stale = _find_quality_issues(memories, days_threshold=180)
 
     # Untagged sessions
-    untagged = find_untagged_sessions(memories)
     if untagged:
         warnings.append(("Untagged Sessions", untagged, "Add tags for better searchability"))
 
     # Never accessed
-    never_accessed = find_never_accessed(memories)
     if never_accessed:
         warnings.append(("Never Accessed", never_accessed, "May be outdated or unused"))
 
@@ -173,7 +244,6 @@ def render_health_check(memories: list, manager: MemoryManager):
         warnings.append(("Potential Duplicates", duplicates, "Check if they should be merged"))
 
     # Stale sessions
-    stale = find_stale_sessions(memories, days_threshold=180)
     if stale:
         warnings.append(("Stale Sessions", stale, "Consider archiving or deleting"))
 
@@ -182,6 +252,7 @@ def render_health_check(memories: list, manager: MemoryManager):
         console.print("[bold yellow]⚠ Warnings[/bold yellow]")
         console.print()
 
+        now = datetime.now()
         for warning_type, items, suggestion in warnings:
             if warning_type == "Potential Duplicates":
                 print_section(f"{warning_type} ({len(items)} pair{'s' if len(items) != 1 else ''})")
@@ -205,10 +276,10 @@ def render_health_check(memories: list, manager: MemoryManager):
                     # Add context based on warning type
                     context = ""
                     if warning_type == "Never Accessed" and item.created:
-                        days_old = (datetime.now() - item.created).days
+                        days_old = (now - item.created).days
                         context = f" (created {days_old}d ago)"
                     elif warning_type == "Stale Sessions" and item.created:
-                        days_old = (datetime.now() - item.created).days
+                        days_old = (now - item.created).days
                         context = f" ({days_old}d old, 0 accesses)"
 
                     console.print(f"  • {title}{context}")
@@ -257,12 +328,10 @@ def render_health_check(memories: list, manager: MemoryManager):
 @click.pass_obj
 def health_cmd(manager: MemoryManager, scope: str):
     """Check memory system health."""
-    # Search all memories
-    memories = manager.search_memory()
-
-    # Filter by scope
-    if scope and scope != "both":
-        memories = [m for m in memories if m.scope.value == scope]
+    # Search memories (a single scope is only read from its own index)
+    memories = manager.search_memory(
+        scope=MemoryScope(scope) if scope and scope != "both" else None
+    )
 
     # Render health check
     render_health_check(memories, manager)
@@ -1,12 +1,15 @@
 """Project map visualization."""
 
-from collections import Counter
+import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.tree import Tree
 
+from claude_memory.index import IndexManager
 from claude_memory.memory import MemoryManager
 from claude_memory.models import MemoryScope
 from claude_memory.viz.utils import (
@@ -18,9 +21,49 @@ from claude_memory.viz.utils import (
 )
 
 
+# How many directory levels below each search path are scanned for .claude
+_MAX_SCAN_DEPTH = 4
+
+# Directories that never hold projects of their own (besides hidden ones)
+_SKIP_DIRS = frozenset({
+    "node_modules", "__pycache__", "venv", "Library", "Caches", "target", "dist", "build",
+})
+
+
+def _scan_for_claude_dirs(root: Path, max_depth: int = _MAX_SCAN_DEPTH):
+    """Yield .claude directories up to max_depth levels below root.
+
+    Hidden directories (.git, .venv, .cache, ...) and common dependency and
+    build directories are not descended into, and symlinks are not followed.
+    """
+    queue = deque([(str(root), 0)])
+    while queue:
+        path, depth = queue.popleft()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            # Skip directories we can't access
+            continue
+
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+
+            if entry.name == ".claude":
+                yield Path(entry.path)
+            elif depth + 1 < max_depth and not entry.name.startswith(".") and (
+                entry.name not in _SKIP_DIRS
+            ):
+                queue.append((entry.path, depth + 1))
+
+
 def find_all_projects() -> list[Path]:
     """Find all directories containing .claude folders."""
-    projects = []
+    projects = set()
 
     # Start from home directory and common code directories
     search_paths = [
@@ -33,17 +76,11 @@ def find_all_projects() -> list[Path]:
     ]
 
     for search_path in search_paths:
-        if not search_path.exists():
+        if not search_path.is_dir():
             continue
 
-        # Find .claude directories (limit depth to avoid scanning entire filesystem)
-        try:
-            for claude_dir in search_path.rglob(".claude"):
-                if claude_dir.is_dir() and (claude_dir.parent not in projects):
-                    projects.append(claude_dir.parent)
-        except (PermissionError, OSError):
-            # Skip directories we can't access
-            continue
+        for claude_dir in _scan_for_claude_dirs(search_path):
+            projects.add(claude_dir.parent)
 
     return sorted(projects)
 
@@ -56,12 +93,10 @@ def analyze_project(project_path: Path) -> Optional[dict]:
 
     # Create memory manager for this project
     try:
-        manager = MemoryManager(project_path)
-        if not manager.project_index:
-            return None
-
-        # Search project memories only
-        memories = [m for m in manager.search_memory() if m.scope == MemoryScope.PROJECT]
+        # Read only this project's index (base + pending log); a full
+        # MemoryManager would also load and initialize the global memory
+        index = IndexManager(claude_dir, MemoryScope.PROJECT).read_index(include_logs=True)
+        memories = [m for m in index.search() if m.scope == MemoryScope.PROJECT]
 
         if not memories:
             return None
@@ -78,11 +113,8 @@ def analyze_project(project_path: Path) -> Optional[dict]:
         most_accessed = max(memories, key=lambda m: m.access.count if m.access else 0)
 
         # Top tags
-        all_tags = []
-        for m in memories:
-            if m.tags:
-                all_tags.extend(m.tags)
-        top_tags = Counter(all_tags).most_common(5)
+        tag_counts = Counter(chain.from_iterable(m.tags for m in memories if m.tags))
+        top_tags = tag_counts.most_common(5)
 
         return {
             "path": project_path,
@@ -110,12 +142,13 @@ def render_project_map():
         console.print("No projects with memory found.", style="yellow")
         return
 
-    # Analyze each project
-    project_stats = []
-    for project in projects:
-        stats = analyze_project(project)
-        if stats:
-            project_stats.append(stats)
+    # Analyze each project; they are independent and mostly wait on file reads
+    if len(projects) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            results = list(executor.map(analyze_project, projects))
+    else:
+        results = [analyze_project(project) for project in projects]
+    project_stats = [stats for stats in results if stats]
 
     if not project_stats:
         console.print("No projects with valid memory found.", style="yellow")
@@ -127,8 +160,8 @@ def render_project_map():
     console.print(f"Found {len(project_stats)} active project{'s' if len(project_stats) != 1 else ''} with memory")
     console.print()
 
-    # Build tree
-    tree = Tree("[bold]Projects[/]", hide_root=True)
+    # Build the map as plain lines with tree guides, printed in one go
+    lines = []
 
     total_sessions = 0
     total_accesses = 0
@@ -142,8 +175,8 @@ def render_project_map():
         if len(project_path_str) > 60:
             project_path_str = "..." + project_path_str[-57:]
 
-        node_label = f"[bold bright_cyan]{project_name}[/] [dim]({project_path_str})[/]"
-        project_node = tree.add(node_label)
+        lines.append(f"[bold bright_cyan]{project_name}[/] [dim]({project_path_str})[/]")
+        children = []
 
         # Stats
         sessions = stats["total_sessions"]
@@ -154,27 +187,30 @@ def render_project_map():
         total_accesses += accesses
 
         stats_text = f"Sessions: {sessions} | Decisions: {decisions} | Total Accesses: {accesses}"
-        project_node.add(stats_text)
+        children.append(stats_text)
 
         # Most recent
         recent = stats["most_recent"]
         recent_title = truncate_text(recent.title or "Untitled", 50)
         recent_date = format_date(recent.created) if recent.created else "Unknown"
-        project_node.add(f"Most recent: {recent_date} - {recent_title}")
+        children.append(f"Most recent: {recent_date} - {recent_title}")
 
         # Most accessed
         accessed = stats["most_accessed"]
         if accessed.access and accessed.access.count > 0:
             accessed_title = truncate_text(accessed.title or "Untitled", 50)
             access_text = format_access_count(accessed.access.count)
-            project_node.add(f"Most accessed: {accessed_title} ({access_text})")
+            children.append(f"Most accessed: {accessed_title} ({access_text})")
 
         # Top tags
         if stats["top_tags"]:
             tags_str = ", ".join(f"{tag} ({count})" for tag, count in stats["top_tags"])
-            project_node.add(f"Top tags: {tags_str}")
+            children.append(f"Top tags: {tags_str}")
+
+        lines.extend(f"├── {child}" for child in children[:-1])
+        lines.append(f"└── {children[-1]}")
 
-    console.print(tree)
+    console.print("\n".join(lines))
     console.print()
 
     # Summary
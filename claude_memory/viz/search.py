@@ -1,13 +1,16 @@
 """Search interface for memory visualization."""
 
+import sys
 from datetime import datetime, timedelta
 from typing import Optional
 
 import click
-from rich.panel import Panel
+from rich import box
+from rich.table import Table
 from rich.text import Text
 
 from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
 from claude_memory.viz.utils import (
     COLORS,
     console,
@@ -17,11 +20,29 @@ from claude_memory.viz.utils import (
     print_header,
     truncate_text,
 )
-from claude_memory.viz.export import memories_to_json, memories_to_markdown
+from claude_memory.viz.export import (
+    memories_to_json_bytes,
+    memories_to_markdown,
+    memories_to_ndjson,
+)
+
+
+def _write_stdout_bytes(content: bytes) -> None:
+    """Write already-encoded UTF-8 output to stdout, skipping print()'s encode step."""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        # Text-only stdout (e.g. captured output)
+        sys.stdout.write(content.decode())
+        return
+
+    sys.stdout.flush()
+    stream.write(content)
+    stream.flush()
 
 
 def sort_by_relevance(memories: list) -> list:
     """Sort memories by relevance (access count + recency)."""
+    now = datetime.now()
 
     def relevance_score(memory):
         # Access count contributes to score
@@ -30,7 +51,7 @@ def sort_by_relevance(memories: list) -> list:
         # Recency contributes to score
         recency_score = 0
         if memory.created:
-            days_old = (datetime.now() - memory.created).days
+            days_old = (now - memory.created).days
             # Newer memories get higher scores (max 10 points, decaying over 365 days)
             recency_score = max(0, 10 - (days_old / 36.5))
 
@@ -71,7 +92,11 @@ def render_search_results(
     # Sort by relevance
     memories = sort_by_relevance(memories)
 
-    # Display results
+    # Display results as rows of one table, rendered in a single print
+    results_table = Table(show_header=False, show_lines=True, box=box.SIMPLE, border_style="dim")
+    results_table.add_column("Result", overflow="fold")
+    colors_get = COLORS.get
+
     for i, memory in enumerate(memories, 1):
         # Build result content
         content = []
@@ -83,9 +108,11 @@ def render_search_results(
 
         # Metadata line
         date_str = format_date(memory.created) if memory.created else "Unknown"
-        scope_color = COLORS.get(memory.scope.value, "white")
-        type_color = COLORS.get(memory.type.value, "white")
-        meta = f"{date_str} | [{scope_color}]{memory.scope.value}[/] | [{type_color}]{memory.type.value}[/]"
+        scope_name = memory.scope.value
+        type_name = memory.type.value
+        scope_color = colors_get(scope_name, "white")
+        type_color = colors_get(type_name, "white")
+        meta = f"{date_str} | [{scope_color}]{scope_name}[/] | [{type_color}]{type_name}[/]"
         content.append(meta)
 
         # Tags
@@ -113,14 +140,9 @@ def render_search_results(
             summary = truncate_text(memory.summary, max_length=200)
             content.append(f"[dim]{summary}[/]")
 
-        # Create panel for this result
-        panel = Panel(
-            "\n".join(content),
-            border_style="dim",
-            padding=(0, 1),
-        )
-        console.print(panel)
+        results_table.add_row("\n".join(content))
 
+    console.print(results_table)
     console.print()
     console.print("[dim]Tip: Use 'claude-memory viz session <id>' to view full details[/]")
 
@@ -142,8 +164,8 @@ def render_search_results(
 @click.option("--never-accessed", is_flag=True, help="Show only never-accessed memories")
 @click.option(
     "--export",
-    type=click.Choice(["json", "markdown"]),
-    help="Export results to specified format (output to stdout)",
+    type=click.Choice(["json", "ndjson", "markdown"]),
+    help="Export results to specified format (output to stdout, ndjson = one memory per line)",
 )
 @click.pass_obj
 def search_cmd(
@@ -163,29 +185,11 @@ def search_cmd(
     # Parse tags filter
     tags = [t.strip() for t in tags_filter.split(",")] if tags_filter else None
 
-    # Search
-    memories = manager.search_memory(
-        query=query if query else None,
-        tags=tags,
-    )
-
-    # Filter by scope
-    if scope and scope != "both":
-        memories = [m for m in memories if m.scope.value == scope]
-
-    # Filter by creation date
-    if days:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        memories = [m for m in memories if m.created and m.created >= cutoff_date]
-
-    # Filter by access date
+    # Parse access date filters
+    after_date = before_date = None
     if accessed_after:
         try:
             after_date = datetime.strptime(accessed_after, "%Y-%m-%d")
-            memories = [
-                m for m in memories
-                if m.access and m.access.last_accessed and m.access.last_accessed >= after_date
-            ]
         except ValueError:
             console.print(f"Invalid date format: {accessed_after}. Use YYYY-MM-DD", style="red")
             return
@@ -193,28 +197,55 @@ def search_cmd(
     if accessed_before:
         try:
             before_date = datetime.strptime(accessed_before, "%Y-%m-%d")
-            memories = [
-                m for m in memories
-                if m.access and m.access.last_accessed and m.access.last_accessed <= before_date
-            ]
         except ValueError:
             console.print(f"Invalid date format: {accessed_before}. Use YYYY-MM-DD", style="red")
             return
 
+    # Search (a single scope skips reading the other index entirely)
+    memories = manager.search_memory(
+        query=query if query else None,
+        tags=tags,
+        scope=MemoryScope(scope) if scope and scope != "both" else None,
+    )
+
+    # Collect the active filters, then apply them all in one pass
+    predicates = []
+
+    # Filter by creation date
+    if days:
+        cutoff_date = datetime.now() - timedelta(days=days)
+        predicates.append(lambda m: m.created and m.created >= cutoff_date)
+
+    # Filter by access date
+    if after_date:
+        predicates.append(
+            lambda m: m.access and m.access.last_accessed and m.access.last_accessed >= after_date
+        )
+
+    if before_date:
+        predicates.append(
+            lambda m: m.access and m.access.last_accessed and m.access.last_accessed <= before_date
+        )
+
     # Filter by access count
     if never_accessed:
-        memories = [m for m in memories if not m.access or m.access.count == 0]
+        predicates.append(lambda m: not m.access or m.access.count == 0)
     else:
         if min_accesses is not None:
-            memories = [m for m in memories if m.access and m.access.count >= min_accesses]
+            predicates.append(lambda m: m.access and m.access.count >= min_accesses)
 
         if max_accesses is not None:
-            memories = [m for m in memories if m.access and m.access.count <= max_accesses]
+            predicates.append(lambda m: m.access and m.access.count <= max_accesses)
+
+    if predicates:
+        memories = [m for m in memories if all(predicate(m) for predicate in predicates)]
 
     # Export if requested
     if export:
         if export == "json":
-            print(memories_to_json(memories))
+            _write_stdout_bytes(memories_to_json_bytes(memories) + b"\n")
+        elif export == "ndjson":
+            sys.stdout.writelines(memories_to_ndjson(memories))
         elif export == "markdown":
             print(memories_to_markdown(memories, title=f'Search Results: "{query}"'))
         return
@@ -24,17 +24,17 @@ def find_related_sessions(manager: MemoryManager, memory: MemoryEntry, max_resul
     if not memory.tags:
         return []
 
-    all_memories = manager.search_memory()
+    # A tag search only returns memories sharing at least one tag
+    tags = set(memory.tags)
     related = []
 
-    for other in all_memories:
+    for other in manager.search_memory(tags=memory.tags):
         if other.id == memory.id:
             continue
 
-        if other.tags:
-            overlap = set(memory.tags) & set(other.tags)
-            if overlap:
-                related.append((other, len(overlap)))
+        overlap = len(tags.intersection(other.tags))
+        if overlap:
+            related.append((other, overlap))
 
     # Sort by overlap count, then by date
     related.sort(
@@ -1,5 +1,6 @@
 """Statistics dashboard for memory visualization."""
 
+import heapq
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
@@ -9,6 +10,7 @@ from rich.table import Table
 from rich.text import Text
 
 from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
 from claude_memory.viz.utils import (
     console,
     create_progress_bar,
@@ -21,8 +23,13 @@ from claude_memory.viz.utils import (
 from claude_memory.viz.export import stats_to_json, export_to_markdown
 
 
-def calculate_stats(memories: list) -> dict:
-    """Calculate comprehensive statistics from memories."""
+def calculate_stats(memories: list, top_n: Optional[int] = None) -> dict:
+    """Calculate comprehensive statistics from memories.
+
+    With top_n, most_accessed and never_accessed keep only their first top_n
+    entries (picked with a heap instead of sorting everything); the full
+    never-accessed count is always in never_accessed_count.
+    """
     stats = {
         "total": len(memories),
         "by_scope": Counter(),
@@ -34,46 +41,72 @@ def calculate_stats(memories: list) -> dict:
         "by_week": defaultdict(lambda: {"count": 0, "accesses": 0}),
         "tags": Counter(),
     }
+    now = datetime.now()
+
+    # Bind the accumulators to locals once; this loop runs per memory
+    by_scope = stats["by_scope"]
+    by_type = stats["by_type"]
+    accessed_count = stats["accessed_count"]
+    most_accessed = stats["most_accessed"]
+    never_accessed = stats["never_accessed"]
+    by_week = stats["by_week"]
+    tag_counts = stats["tags"]
+    total_accesses = 0
 
     for memory in memories:
         # Scope and type counts
-        stats["by_scope"][memory.scope.value] += 1
-        stats["by_type"][memory.type.value] += 1
+        type_name = memory.type.value
+        by_scope[memory.scope.value] += 1
+        by_type[type_name] += 1
 
         # Access counts
-        access_count = memory.access.count if memory.access else 0
-        stats["total_accesses"] += access_count
-        stats["accessed_count"][memory.type.value] += access_count
+        access = memory.access
+        access_count = access.count if access else 0
+        total_accesses += access_count
+        accessed_count[type_name] += access_count
 
         # Track for most/never accessed
         if access_count > 0:
-            stats["most_accessed"].append((memory, access_count))
+            most_accessed.append((memory, access_count))
         else:
-            stats["never_accessed"].append(memory)
+            never_accessed.append(memory)
 
         # Activity by week
-        if memory.created:
+        created = memory.created
+        if created:
             # Calculate week number (0 = current week)
-            days_old = (datetime.now() - memory.created).days
+            days_old = (now - created).days
             week_num = days_old // 7
 
             if week_num < 13:  # Last 90 days = ~13 weeks
-                week_key = f"Week {13 - week_num}"
-                stats["by_week"][week_key]["count"] += 1
-                stats["by_week"][week_key]["accesses"] += access_count
+                week = by_week[f"Week {13 - week_num}"]
+                week["count"] += 1
+                week["accesses"] += access_count
 
         # Tag counts
         if memory.tags:
-            for tag in memory.tags:
-                stats["tags"][tag] += 1
+            tag_counts.update(memory.tags)
 
-    # Sort most accessed
-    stats["most_accessed"].sort(key=lambda x: x[1], reverse=True)
+    stats["total_accesses"] = total_accesses
 
-    # Sort never accessed by date (oldest first)
-    stats["never_accessed"].sort(
-        key=lambda m: m.created if m.created else datetime.max
-    )
+    stats["never_accessed_count"] = len(never_accessed)
+
+    def access_key(item):
+        return item[1]
+
+    def created_key(memory):
+        return memory.created if memory.created else datetime.max
+
+    if top_n is not None:
+        # Same entries as sorting and slicing, without sorting the rest
+        stats["most_accessed"] = heapq.nlargest(top_n, most_accessed, key=access_key)
+        stats["never_accessed"] = heapq.nsmallest(top_n, never_accessed, key=created_key)
+    else:
+        # Sort most accessed
+        most_accessed.sort(key=access_key, reverse=True)
+
+        # Sort never accessed by date (oldest first)
+        never_accessed.sort(key=created_key)
 
     return stats
 
@@ -84,7 +117,7 @@ def render_stats_dashboard(memories: list, scope_filter: Optional[str] = None):
         console.print("No memories found.", style="yellow")
         return
 
-    stats = calculate_stats(memories)
+    stats = calculate_stats(memories, top_n=10)
 
     # Overview section
     print_header("Memory Statistics")
@@ -143,21 +176,22 @@ def render_stats_dashboard(memories: list, scope_filter: Optional[str] = None):
 
     # Never Accessed
     if stats["never_accessed"]:
-        print_section(f"Never Accessed ({len(stats['never_accessed'])})")
+        print_section(f"Never Accessed ({stats['never_accessed_count']})")
 
+        now = datetime.now()
         for memory in stats["never_accessed"][:10]:
             title = memory.title or "Untitled"
             title_short = truncate_text(title, max_length=50)
 
             created = ""
             if memory.created:
-                days_old = (datetime.now() - memory.created).days
+                days_old = (now - memory.created).days
                 created = f" (created {days_old}d ago)"
 
             console.print(f"  • {title_short}{created}", style="dim")
 
-        if len(stats["never_accessed"]) > 10:
-            console.print(f"  [dim]... and {len(stats['never_accessed']) - 10} more[/]")
+        if stats["never_accessed_count"] > 10:
+            console.print(f"  [dim]... and {stats['never_accessed_count'] - 10} more[/]")
 
         console.print()
 
@@ -207,16 +241,14 @@ def render_stats_dashboard(memories: list, scope_filter: Optional[str] = None):
 @click.pass_obj
 def stats_cmd(manager: MemoryManager, scope: str, export: Optional[str]):
     """Display statistics dashboard."""
-    # Search all memories
-    memories = manager.search_memory()
-
-    # Filter by scope
-    if scope and scope != "both":
-        memories = [m for m in memories if m.scope.value == scope]
+    # Search memories (a single scope is only read from its own index)
+    memories = manager.search_memory(
+        scope=MemoryScope(scope) if scope and scope != "both" else None
+    )
 
     # Export if requested
     if export:
-        stats = calculate_stats(memories)
+        stats = calculate_stats(memories, top_n=10)
         if export == "json":
             print(stats_to_json(stats))
         return
@@ -1,6 +1,7 @@
 """Tag network and cloud visualization."""
 
 from collections import Counter, defaultdict
+from itertools import combinations
 from typing import Optional
 
 import click
@@ -8,6 +9,7 @@ from rich.table import Table
 from rich.tree import Tree
 
 from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
 from claude_memory.viz.utils import (
     console,
     create_progress_bar,
@@ -25,24 +27,29 @@ def calculate_tag_stats(memories: list) -> dict:
         "memories_by_tag": defaultdict(list),
     }
 
+    frequency = stats["frequency"]
+    co_occurrence = stats["co_occurrence"]
+    access_by_tag = stats["access_by_tag"]
+    memories_by_tag = stats["memories_by_tag"]
+
     for memory in memories:
         if not memory.tags:
             continue
 
         access_count = memory.access.count if memory.access else 0
 
-        # Track frequency
+        # Track frequency (Counter.update counts the whole list in C)
+        frequency.update(memory.tags)
         for tag in memory.tags:
-            stats["frequency"][tag] += 1
-            stats["memories_by_tag"][tag].append(memory)
-            stats["access_by_tag"][tag]["total"] += access_count
-            stats["access_by_tag"][tag]["count"] += 1
+            memories_by_tag[tag].append(memory)
+            tag_access = access_by_tag[tag]
+            tag_access["total"] += access_count
+            tag_access["count"] += 1
 
-        # Track co-occurrence
-        for i, tag1 in enumerate(memory.tags):
-            for tag2 in memory.tags[i + 1 :]:
-                stats["co_occurrence"][tag1][tag2] += 1
-                stats["co_occurrence"][tag2][tag1] += 1
+        # Track co-occurrence (each pair of positions once, recorded both ways)
+        for tag1, tag2 in combinations(memory.tags, 2):
+            co_occurrence[tag1][tag2] += 1
+            co_occurrence[tag2][tag1] += 1
 
     return stats
 
@@ -148,12 +155,10 @@ def render_tag_cloud(memories: list, min_count: int = 1):
 @click.pass_obj
 def tags_cmd(manager: MemoryManager, min_count: int, scope: str):
     """Display tag cloud and relationship network."""
-    # Search all memories
-    memories = manager.search_memory()
-
-    # Filter by scope
-    if scope and scope != "both":
-        memories = [m for m in memories if m.scope.value == scope]
+    # Search memories (a single scope is only read from its own index)
+    memories = manager.search_memory(
+        scope=MemoryScope(scope) if scope and scope != "both" else None
+    )
 
     # Render tag cloud and network
     render_tag_cloud(memories, min_count=min_count)
@@ -27,12 +27,16 @@ from claude_memory.viz.utils import (
 
 def group_by_month(memories: list) -> dict[str, list]:
     """Group memories by year-month."""
+    # Bucket on (year, month) and only format the handful of group labels
     grouped = defaultdict(list)
     for memory in memories:
-        if memory.created:
-            month_key = memory.created.strftime("%Y-%m")
-            grouped[month_key].append(memory)
-    return dict(sorted(grouped.items(), reverse=True))
+        created = memory.created
+        if created:
+            grouped[(created.year, created.month)].append(memory)
+    return {
+        f"{year:04d}-{month:02d}": group
+        for (year, month), group in sorted(grouped.items(), reverse=True)
+    }
 
 
 def render_timeline(
@@ -96,7 +100,8 @@ def render_timeline(
         for memory in month_memories:
             # Build memory summary line
             date_str = format_date(memory.created) if memory.created else "Unknown"
-            scope_text = f"[{COLORS[memory.scope.value]}]{memory.scope.value}[/]"
+            scope_name = memory.scope.value
+            scope_text = f"[{COLORS[scope_name]}]{scope_name}[/]"
             title = memory.title or "Untitled"
 
             # Access info
@@ -156,8 +161,10 @@ def timeline_cmd(
 
     print_header(f"Memory Timeline{days_text}{scope_text}{type_text}")
 
-    # Search all memories
-    memories = manager.search_memory()
+    # Search memories (a single scope is only read from its own index)
+    memories = manager.search_memory(
+        scope=MemoryScope(scope) if scope and scope != "both" else None
+    )
 
     # Render timeline
     render_timeline(
@@ -1,6 +1,7 @@
 """Shared utilities for memory visualization."""
 
-from datetime import datetime
+from datetime import date as date_type, datetime
+from functools import lru_cache
 from typing import Optional
 
 from rich.console import Console
@@ -55,9 +56,15 @@ def format_type(type_name: str) -> Text:
     return Text(type_name, style=color)
 
 
+@lru_cache(maxsize=4096)
+def _format_day(day: date_type) -> str:
+    """Format a calendar date as YYYY-MM-DD (cached; memories share days)."""
+    return day.strftime("%Y-%m-%d")
+
+
 def format_date(date: datetime) -> str:
     """Format datetime as YYYY-MM-DD."""
-    return date.strftime("%Y-%m-%d")
+    return _format_day(date.date())
 
 
 def format_datetime(date: datetime) -> str:
@@ -128,7 +135,9 @@ def create_progress_bar(value: int, max_value: int, width: int = 20) -> str:
     if max_value == 0:
         return "█" * 0
 
-    filled = int((value / max_value) * width)
+    # Integer math: int((value / max_value) * width) can land just below a
+    # whole number (29 / 100 * 100 == 28.999...) and drop a block
+    filled = (value * width) // max_value
     return "█" * filled
 
 
@@ -165,7 +165,8 @@ def apply_filters(memories: list[MemoryEntry], config: dict) -> list[MemoryEntry
 
     # Apply tag filter
     if config['tags']:
-        filtered = [m for m in filtered if any(tag in m.tags for tag in config['tags'])]
+        wanted_tags = set(config['tags'])
+        filtered = [m for m in filtered if not wanted_tags.isdisjoint(m.tags)]
 
     # Apply date range filter
     if config['date_from']:
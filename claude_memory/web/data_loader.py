@@ -5,6 +5,7 @@ from typing import Optional
 
 from claude_memory.memory import MemoryManager
 from claude_memory.models import MemoryEntry
+from claude_memory.utils import find_project_root, get_project_claude_dir
 from claude_memory.viz.stats import calculate_stats
 from claude_memory.viz.tags import calculate_tag_stats
 
@@ -29,7 +30,13 @@ def load_memory_data(
     """
     from claude_memory.models import MemoryScope, MemoryType
 
-    manager = MemoryManager()
+    # The dashboard outlives the memoized project root and shared manager,
+    # so look the root up again and start over if it changed
+    find_project_root.cache_clear()
+    manager = MemoryManager.shared()
+    if manager.project_dir != get_project_claude_dir(manager.working_dir):
+        MemoryManager.reset()
+        manager = MemoryManager.shared()
 
     # Convert scope string to enum
     scope_enum = None
@@ -101,3 +108,5 @@ def get_tag_stats(memories: list[MemoryEntry]) -> dict:
 def clear_cache():
     """Clear all cached data to force reload."""
     st.cache_data.clear()
+    find_project_root.cache_clear()
+    MemoryManager.reset()
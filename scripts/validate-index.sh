@@ -26,7 +26,7 @@ if [ "$SCOPE" = "global" ] || [ "$SCOPE" = "both" ]; then
 
         # Check for log entries
         if [ -d "$HOME/.claude/memory/index-log" ]; then
-            LOG_COUNT=$(ls -1 "$HOME/.claude/memory/index-log"/*.json 2>/dev/null | wc -l)
+            LOG_COUNT=$(( $(cat "$HOME/.claude/memory/index-log/pending.jsonl" 2>/dev/null | wc -l) + $(ls -1 "$HOME/.claude/memory/index-log"/*.json 2>/dev/null | wc -l) ))
             if [ "$LOG_COUNT" -gt 0 ]; then
                 echo "  ⚠ $LOG_COUNT unmerged log entries (consider rebuilding index)"
             else
@@ -57,7 +57,7 @@ if [ "$SCOPE" = "project" ] || [ "$SCOPE" = "both" ]; then
 
         # Check for log entries
         if [ -d ".claude/memory/index-log" ]; then
-            LOG_COUNT=$(ls -1 ".claude/memory/index-log"/*.json 2>/dev/null | wc -l)
+            LOG_COUNT=$(( $(cat ".claude/memory/index-log/pending.jsonl" 2>/dev/null | wc -l) + $(ls -1 ".claude/memory/index-log"/*.json 2>/dev/null | wc -l) ))
             if [ "$LOG_COUNT" -gt 0 ]; then
                 echo "  ⚠ $LOG_COUNT unmerged log entries (consider rebuilding index)"
             else
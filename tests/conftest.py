@@ -0,0 +1,40 @@
+"""Shared fixtures for the test suite."""
+
+from datetime import datetime
+
+import pytest
+
+from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryEntry, MemoryScope, MemoryType
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Isolated home directory, with the cwd in an empty project inside it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    project = tmp_path / "project"
+    (project / ".git").mkdir(parents=True)
+    monkeypatch.chdir(project)
+
+    MemoryManager.reset()
+    yield tmp_path
+    MemoryManager.reset()
+
+
+@pytest.fixture
+def make_memory():
+    """Factory for minimal memory entries."""
+
+    def make(memory_id: str, title: str = "Untitled") -> MemoryEntry:
+        now = datetime.now()
+        return MemoryEntry(
+            id=memory_id,
+            type=MemoryType.SESSION,
+            scope=MemoryScope.GLOBAL,
+            file=f"sessions/{memory_id}.md",
+            title=title,
+            created=now,
+            updated=now,
+        )
+
+    return make
@@ -0,0 +1,74 @@
+"""Tests for the batch command: output capture, ordering and exit codes."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from claude_memory.cli import main
+from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
+
+
+@pytest.fixture
+def memory_ids(home):
+    manager = MemoryManager()
+    ids = []
+    for i in range(3):
+        session = manager.create_session()
+        session.update_task(f"Fix auth bug {i}")
+        ids.append(manager.save_session_to_memory(session, MemoryScope.PROJECT).id)
+    MemoryManager.reset()
+    return ids
+
+
+def _run_batch(lines, *args):
+    return CliRunner().invoke(main, ["batch", *args], input="\n".join(lines) + "\n")
+
+
+def test_batch_runs_every_line(memory_ids):
+    result = _run_batch(["# comment", "", "stats", f"show {memory_ids[0]}"])
+
+    assert result.exit_code == 0
+    assert "Project Memory:" in result.output
+    assert f"ID: {memory_ids[0]}" in result.output
+
+
+def test_batch_reports_failures(memory_ids):
+    result = _run_batch(["stats", "no-such-command", "batch", 'search "unclosed'])
+
+    assert result.exit_code == 1
+    assert "Project Memory:" in result.output
+    assert "3 command(s) failed" in result.output
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_batch_output_follows_input_order(memory_ids, jobs):
+    lines = [
+        "viz search auth --export json",
+        "stats",
+        "viz search auth --export ndjson",
+        "search auth",
+    ]
+    result = _run_batch(lines, "--jobs", jobs)
+    output = result.output
+
+    assert result.exit_code == 0
+    json_end = output.index("]\n")
+    stats_at = output.index("Global Memory:")
+    ndjson_at = output.index('{"id"', json_end)
+    search_at = output.index("Found 3 results:")
+    assert json_end < stats_at < ndjson_at < search_at
+
+    exported = json.loads(output[: json_end + 1])
+    ndjson = [json.loads(line) for line in output[ndjson_at:search_at].splitlines() if line]
+    assert {m["id"] for m in exported} == {m["id"] for m in ndjson} == set(memory_ids)
+
+
+def test_batch_jobs_runs_show_in_order_with_stats(memory_ids):
+    lines = ["stats", f"show {memory_ids[0]}", "stats"]
+    result = _run_batch(lines, "--jobs", "4")
+
+    totals = [line for line in result.output.splitlines() if "Total accesses" in line]
+    project_totals = totals[1::2]
+    assert project_totals == ["  Total accesses: 0", "  Total accesses: 1"]
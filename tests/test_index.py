@@ -0,0 +1,132 @@
+"""Tests for the append-log index: pending log, compaction, rebuild and caching."""
+
+import pytest
+
+from claude_memory.index import IndexManager
+from claude_memory.memory import MemoryManager
+from claude_memory.models import MemoryScope
+
+
+@pytest.fixture
+def index_manager(tmp_path):
+    manager = IndexManager(tmp_path / ".claude", MemoryScope.GLOBAL)
+    manager.initialize()
+    return manager
+
+
+def _titles(index):
+    return [(m.id, m.title) for m in index.memories]
+
+
+def test_add_update_delete_round_trip(index_manager, make_memory):
+    index_manager.add_memory(make_memory("a", "A"), "s1")
+    index_manager.add_memory(make_memory("b", "B"), "s1")
+    index_manager.add_memory(make_memory("c", "C"), "s1")
+    index_manager.update_memory("b", make_memory("b", "B2"), "s2")
+    index_manager.delete_memory("c", "s2")
+
+    assert index_manager.log_path.read_bytes().count(b"\n") == 5
+    assert _titles(index_manager.read_index()) == [("a", "A"), ("b", "B2")]
+    # Nothing is merged into index.json until a rebuild
+    assert index_manager.read_index(include_logs=False).memories == []
+
+
+def test_compaction_keeps_merged_index(index_manager, make_memory):
+    index_manager.add_memory(make_memory("a", "A"), "s1")
+    index_manager.add_memory(make_memory("b", "B"), "s1")
+    for title in ("B2", "B3", "B4"):
+        index_manager.update_memory("b", make_memory("b", title), "s2")
+    index_manager.delete_memory("a", "s2")
+    index_manager.add_memory(make_memory("a", "A2"), "s2")
+
+    before = _titles(index_manager.read_index())
+    remaining = index_manager.compact_logs()
+
+    assert remaining < 7
+    assert remaining == index_manager.pending_entries()
+    assert _titles(index_manager.read_index()) == before == [("b", "B4"), ("a", "A2")]
+
+
+def test_compaction_leaves_add_only_log_alone(index_manager, make_memory):
+    for memory_id in ("a", "b", "c"):
+        index_manager.add_memory(make_memory(memory_id), "s1")
+    log = index_manager.log_path.read_bytes()
+
+    assert index_manager.compact_logs() == 3
+    assert index_manager.log_path.read_bytes() == log
+
+
+def test_rebuild_merges_log_into_index(index_manager, make_memory):
+    index_manager.add_memory(make_memory("a", "A"), "s1")
+    index_manager.add_memory(make_memory("b", "B"), "s1")
+    index_manager.update_memory("a", make_memory("a", "A2"), "s2")
+    index_manager.compact_logs()
+
+    index_manager.rebuild_index()
+
+    assert not index_manager.log_path.exists()
+    assert index_manager.pending_entries() == 0
+    base = index_manager.read_index(include_logs=False)
+    assert _titles(base) == [("a", "A2"), ("b", "B")]
+    assert base.stats["total_memories"] == 2
+
+
+def test_read_index_sees_writes_from_another_manager(index_manager, make_memory):
+    other = IndexManager(index_manager.claude_dir, MemoryScope.GLOBAL)
+    index_manager.add_memory(make_memory("a", "A"), "s1")
+    assert _titles(index_manager.read_index()) == [("a", "A")]
+
+    other.add_memory(make_memory("b", "B"), "s2")
+    assert _titles(index_manager.read_index()) == [("a", "A"), ("b", "B")]
+
+    other.update_memory("a", make_memory("a", "A2"), "s2")
+    assert _titles(index_manager.read_index()) == [("a", "A2"), ("b", "B")]
+
+    other.rebuild_index()
+    assert _titles(index_manager.read_index()) == [("a", "A2"), ("b", "B")]
+
+
+def test_read_index_returns_independent_copies(index_manager, make_memory):
+    index_manager.add_memory(make_memory("a"), "s1")
+    first = index_manager.read_index()
+    first.memories = []
+
+    assert len(index_manager.read_index().memories) == 1
+
+
+def test_accesses_are_folded_into_index_on_rebuild(index_manager, make_memory):
+    index_manager.add_memory(make_memory("a"), "s1")
+    index_manager.rebuild_index()
+
+    index_manager.record_access("a", "first query")
+    index_manager.record_access("a")
+    index_manager.record_access("missing")
+
+    access = index_manager.read_index().memories[0].access
+    assert access.count == 2
+    assert [s["query"] for s in access.recent_searches] == ["first query"]
+    assert index_manager.pending_accesses() == 3
+    # Recording an access never rewrites index.json
+    assert index_manager.read_index(include_logs=False).memories[0].access.count == 0
+
+    index_manager.rebuild_index()
+
+    assert not index_manager.access_log_path.exists()
+    assert index_manager.read_index(include_logs=False).memories[0].access.count == 2
+    assert index_manager.read_index().memories[0].access.count == 2
+
+
+def test_access_log_is_folded_past_threshold(home):
+    manager = MemoryManager()
+    manager.config.memory["indexRebuild"]["accessThresholdEntries"] = 3
+    session = manager.create_session()
+    session.update_task("Fold accesses")
+    memory = manager.save_session_to_memory(session, MemoryScope.PROJECT)
+
+    manager.record_memory_access(memory.id)
+    manager.record_memory_access(memory.id)
+    assert manager.project_index.pending_accesses() == 2
+
+    manager.record_memory_access(memory.id)
+    assert manager.project_index.pending_accesses() == 0
+    assert manager.get_memory(memory.id).access.count == 3